@@ -0,0 +1,68 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sterncurve.backtest import backtest, summarize
+
+SECTORS = ['Technology', 'Financial Services', 'Healthcare', 'Consumer', 'Energy', 'Industrials']
+
+
+def universe(tickers, days, seed=0):
+    # Random-walk OHLC in the wide (ticker, field) layout bulk_history() returns, with staggered
+    # listing dates so some tickers start part-way through the history.
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days, name='Date')
+    close = 50 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, (days, tickers)), axis=0)) + rng.uniform(0, 200, tickers)
+    open_ = close * (1 + rng.normal(0, 0.005, close.shape))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.015, close.shape))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.015, close.shape))
+    listed = rng.integers(0, days // 4, tickers) * (rng.random(tickers) < 0.2)
+    names = [f"T{i:04d}" for i in range(tickers)]
+    fields = {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': np.ones(close.shape)}
+    columns = {}
+    for i, name in enumerate(names):
+        for field, values in fields.items():
+            column = values[:, i].copy()
+            column[:listed[i]] = np.nan
+            columns[(name, field)] = column
+    bulk = pd.DataFrame(columns, index=index)
+    sectors = {name: SECTORS[i % len(SECTORS)] for i, name in enumerate(names)}
+    return bulk, sectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a universe-wide stochastic signal backtest")
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--hold', type=int, default=10)
+    parser.add_argument('--stop-loss', type=float, default=0.08)
+    parser.add_argument('--take-profit', type=float, default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    bulk, sectors = universe(args.tickers, args.years * 252)
+    print(f"{args.tickers} tickers x {len(bulk)} bars")
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        trades = backtest(bulk, hold=args.hold, stop_loss=args.stop_loss, take_profit=args.take_profit,
+                          sectors=sectors)
+        simulated = time.perf_counter()
+        by_ticker = summarize(trades, ('ticker', 'signal'))
+        by_sector = summarize(trades, ('sector', 'signal'))
+        done = time.perf_counter()
+        if best is None or done - start < best[0]:
+            best = (done - start, simulated - start, done - simulated)
+    print(f"{len(trades)} trades, {len(by_ticker)} ticker rows, {len(by_sector)} sector rows")
+    print(f"backtest {best[1]:.2f}s + summaries {best[2]:.2f}s = {best[0]:.2f}s (best of {args.repeat})")
+    print(by_sector.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The default Analyzer ticker plus every ticker in the Discover sector lists.
+BENCH_TICKERS = [
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA',
+    'JPM', 'BAC', 'GS', 'WFC', 'V', 'MA', 'BRK-B',
+    'JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'ABT', 'MRK',
+    'WMT', 'HD', 'NKE', 'SBUX', 'MCD', 'DIS', 'COST',
+    'XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX',
+    'BA', 'CAT', 'GE', 'HON', 'UPS', 'MMM', 'DE'
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Analyzer and Discover pages against replayed data")
+    parser.add_argument('--fixtures', help="replay fixture directory (synthesized when omitted)")
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated seconds per provider call")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--universe', default="Magnificent 7 (Tech)", help="Discover sector or universe to scan")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sterncurve-bench-')
+    fixtures = args.fixtures
+    if fixtures is None:
+        from sterncurve.providers import synthesize_fixtures
+        from sterncurve.screener import BUNDLED_UNIVERSES, load_universe
+        tickers = list(BENCH_TICKERS)
+        if args.universe in BUNDLED_UNIVERSES:
+            tickers += [t for t in load_universe(args.universe) if t not in tickers]
+        fixtures = os.path.join(workdir, 'fixtures')
+        synthesize_fixtures(tickers, fixtures)
+
+    os.environ['STERNCURVE_PROVIDER'] = 'replay'
+    os.environ['STERNCURVE_REPLAY_DIR'] = fixtures
+    os.environ['STERNCURVE_REPLAY_LATENCY'] = str(args.latency)
+    os.environ['STERNCURVE_DATA_DIR'] = os.path.join(workdir, 'data')
+
+    from streamlit.testing.v1 import AppTest
+
+    for run in range(args.repeat):
+        at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=600)
+        start = time.perf_counter()
+        at.run()
+        analysis = time.perf_counter() - start
+
+        next(b for b in at.sidebar.button if b.label == "Discover Stocks").click().run()
+        at.selectbox[0].select(args.universe).run()
+        start = time.perf_counter()
+        next(b for b in at.button if b.label.startswith("🔍 Analyze")).click().run()
+        discover = time.perf_counter() - start
+
+        if at.exception:
+            raise SystemExit(at.exception[0].message)
+        scanned = len(at.session_state.discovery_results) if 'discovery_results' in at.session_state else 0
+        print(f"run {run + 1}: analysis page {analysis * 1000:.0f} ms, "
+              f"{args.universe} scan {discover * 1000:.0f} ms ({scanned} stocks)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import websockets
+except ImportError:
+    sys.exit("bench_reruns.py needs the websockets package: pip install -r benchmarks/requirements.txt")
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench_discover import BENCH_TICKERS
+
+# AppTest always reruns the whole script, so this drives a real `streamlit run` server over its
+# websocket the way the browser does: a widget inside a fragment sends that fragment's id and
+# gets a fragment-only rerun back.
+RERUN_PENDING = ForwardMsg.FINISHED_EARLY_FOR_RERUN
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}
+        self.values = {}
+
+    async def run(self, trigger=None, fragment_id=''):
+        # Returns (milliseconds until the final script_finished, deltas received).
+        msg = BackMsg()
+        msg.rerun_script.fragment_id = fragment_id
+        for widget_id, (field, value) in self.values.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            if field == 'string_array_value':
+                state.string_array_value.data.extend(value)
+            else:
+                setattr(state, field, value)
+        if trigger:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        deltas = 0
+        seen = {}
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof('type')
+            if kind == 'delta':
+                deltas += 1
+                if fwd.delta.WhichOneof('type') == 'new_element':
+                    element = fwd.delta.new_element
+                    widget = getattr(element, element.WhichOneof('type'))
+                    if hasattr(widget, 'id') and hasattr(widget, 'label'):
+                        seen[widget.id] = (widget.label, fwd.delta.fragment_id)
+            elif kind == 'script_finished' and fwd.script_finished != RERUN_PENDING:
+                break
+        elapsed = (time.perf_counter() - start) * 1000
+        if fragment_id:
+            self.widgets = {k: v for k, v in self.widgets.items() if v[1] != fragment_id}
+            self.widgets.update(seen)
+        else:
+            self.widgets = seen
+        return elapsed, deltas
+
+    def find(self, label):
+        return [(widget_id, fragment_id) for widget_id, (widget_label, fragment_id) in self.widgets.items()
+                if widget_label == label]
+
+    async def click(self, label, index=0):
+        widget_id, fragment_id = self.find(label)[index]
+        return await self.run(widget_id, fragment_id)
+
+    async def set(self, label, field, value):
+        widget_id, fragment_id = self.find(label)[0]
+        self.values[widget_id] = (field, value)
+        return await self.run(fragment_id=fragment_id)
+
+
+async def measure(port, args):
+    timings = {}
+    async with websockets.connect(f'ws://127.0.0.1:{port}/_stcore/stream', subprotocols=['streamlit'],
+                                  max_size=None) as ws:
+        session = Session(ws)
+        await session.run()
+        for _ in range(args.repeat):
+            timings.setdefault("Analyzer: Add to Portfolio", []).append(await session.click("⭐ Add to Portfolio"))
+            timings.setdefault("Analyzer: Remove", []).append(await session.click("🗑️ Remove"))
+
+        await session.click("Discover Stocks")
+        await session.set("Choose a sector or universe", 'string_value', args.universe)
+        await session.click(f"🔍 Analyze {args.universe}")
+        for _ in range(args.repeat):
+            for sort in ("Momentum", "Score (High to Low)"):
+                timings.setdefault("Discover: change sort", []).append(
+                    await session.set("Sort by", 'string_value', sort))
+            for positions in (["Oversold", "Overbought"], ["Oversold", "Neutral", "Overbought"]):
+                timings.setdefault("Discover: change filter", []).append(
+                    await session.set("Filter by Position", 'string_array_value', positions))
+            if session.find("⭐ Add to Portfolio"):
+                timings.setdefault("Discover: Add to Portfolio", []).append(
+                    await session.click("⭐ Add to Portfolio", -1))
+
+        await session.click("SternCurve Portfolio")
+        for _ in range(args.repeat):
+            if not session.find("Remove"):
+                break
+            timings.setdefault("Portfolio: Remove", []).append(await session.click("Remove"))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time click-to-update latency of the interactive regions")
+    parser.add_argument('--fixtures', help="replay fixture directory (synthesized when omitted)")
+    parser.add_argument('--universe', default="Nasdaq-100", help="Discover universe scanned before timing sort/filter")
+    parser.add_argument('--holdings', type=int, default=25, help="portfolio size for the Remove timing")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sterncurve-bench-')
+    fixtures = args.fixtures
+    tickers = list(BENCH_TICKERS)
+    from sterncurve.screener import BUNDLED_UNIVERSES, load_universe
+    if args.universe in BUNDLED_UNIVERSES:
+        tickers += [t for t in load_universe(args.universe) if t not in tickers]
+    if fixtures is None:
+        from sterncurve.providers import synthesize_fixtures
+        fixtures = os.path.join(workdir, 'fixtures')
+        synthesize_fixtures(tickers, fixtures)
+
+    data_dir = os.path.join(workdir, 'data')
+    env = dict(os.environ, STERNCURVE_PROVIDER='replay', STERNCURVE_REPLAY_DIR=fixtures,
+               STERNCURVE_DATA_DIR=data_dir, STERNCURVE_PREWARM_SCHEDULE='off')
+
+    from sterncurve.portfolio_store import PortfolioStore
+    PortfolioStore(os.path.join(data_dir, 'portfolio.db')).upsert_many(
+        {'ticker': t, 'stoch_k': 50.0, 'stoch_d': 50.0, 'momentum': 0.0, 'trend': 'mixed',
+         'position': 'Neutral', 'last_updated': ''} for t in tickers[1:args.holdings + 1])
+
+    port = free_port()
+    server = subprocess.Popen([sys.executable, '-m', 'streamlit', 'run', os.path.join(ROOT, 'app.py'),
+                               '--server.headless', 'true', '--server.port', str(port),
+                               '--server.enableXsrfProtection', 'false'],
+                              env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(150):
+            try:
+                socket.create_connection(('127.0.0.1', port)).close()
+                break
+            except OSError:
+                time.sleep(0.2)
+        timings = asyncio.run(measure(port, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'interaction':<30} {'runs':>5} {'median ms':>10} {'max ms':>8} {'deltas':>7}")
+    for name, runs in timings.items():
+        elapsed = [ms for ms, _ in runs]
+        deltas = statistics.median(count for _, count in runs)
+        print(f"{name:<30} {len(runs):>5} {statistics.median(elapsed):>10.1f} {max(elapsed):>8.1f} {deltas:>7.0f}")
+
+
+if __name__ == '__main__':
+    main()
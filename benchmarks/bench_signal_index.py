@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_backtest import universe
+from sterncurve.signal_index import SignalIndex
+
+
+def timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time building, updating and querying the signal-event index")
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--new-bars', type=int, default=1, help="bars appended per ticker in the update step")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    bulk, sectors = universe(args.tickers, args.years * 252 + args.new_bars)
+    history, fresh = bulk.iloc[:-args.new_bars], bulk.iloc[-args.new_bars - 1:]
+    index = SignalIndex(os.path.join(tempfile.mkdtemp(prefix='sterncurve-bench-'), 'signals.db'))
+    print(f"{args.tickers} tickers x {len(history)} bars")
+
+    start = time.perf_counter()
+    events = index.ingest_bulk(history)
+    index.set_sectors(sectors)
+    print(f"build: {events} events in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    events = index.ingest_bulk(fresh)
+    print(f"update: {args.new_bars} new bar(s) per ticker, {events} events in "
+          f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+    latest = pd.Timestamp(index.latest_date())
+    queries = {
+        "oversold bullish crosses, last 5 days": dict(events='bullish_cross', k_below=20,
+                                                       since=latest - pd.Timedelta(days=5)),
+        "all events, last 20 days": dict(since=latest - pd.Timedelta(days=20)),
+        "overbought entries in one sector, 1y": dict(events='overbought', sectors=sectors['T0000'],
+                                                     since=latest - pd.Timedelta(days=365)),
+        "one ticker, full history": dict(tickers='T0001'),
+        "newest 100 events": dict(limit=100)
+    }
+    print(f"{'query':<40} {'rows':>7} {'median ms':>10}")
+    for name, query in queries.items():
+        found, ms = timed(lambda: index.query(**query), args.repeat)
+        print(f"{name:<40} {len(found):>7} {ms:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter: time the import statements, then report peak resident memory.
+CHILD = """
+import resource, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], '<imports>', 'exec'))
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+print(elapsed, rss, len(sys.modules))
+"""
+
+CORE_MODULES = ['stochastic', 'fundamentals', 'screener', 'report', 'providers', 'fetcher', 'price_store',
+                'portfolio_store', 'signal_index', 'backtest', 'sweep', 'prewarm', 'symbols', 'scan', 'watch']
+
+
+def app_imports():
+    # The module-level import statements of app.py, i.e. what every cold start and new server
+    # process pays before the first page renders.
+    with open(os.path.join(ROOT, 'app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return '\n'.join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def measure(code, repeat):
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', CHILD, code], cwd=ROOT, capture_output=True, text=True,
+                             check=True).stdout.split()
+        runs.append((float(out[0]), int(out[1]), int(out[2])))
+    return (statistics.median(r[0] for r in runs), statistics.median(r[1] for r in runs),
+            statistics.median(r[2] for r in runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time and resident memory of the core package vs the app")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = app_imports()
+    cases = {
+        "python (bare)": "pass",
+        "sterncurve": "import sterncurve",
+        "sterncurve: scan + fundamentals": "import sterncurve.screener, sterncurve.fundamentals, sterncurve.report",
+        "sterncurve: every module": "\n".join(f"import sterncurve.{m}" for m in CORE_MODULES),
+        "sterncurve + yfinance (live data)": "import sterncurve.providers, yfinance",
+        "app.py imports": app,
+        "app.py imports + yfinance": app + "\nimport yfinance"
+    }
+    print(f"{'imports':<36} {'ms':>8} {'peak RSS MB':>12} {'modules':>8}")
+    for name, code in cases.items():
+        elapsed, rss, modules = measure(code, args.repeat)
+        print(f"{name:<36} {elapsed * 1000:>8.0f} {rss / 2 ** 20:>12.1f} {modules:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sterncurve.stochastic import calculate_stochastic, rolling_max, rolling_min
+
+
+def pandas_stochastic(high, low, close, k_period=14, d_period=3):
+    # The pre-kernel implementation, kept here as the baseline.
+    lowest_low = low.rolling(window=k_period).min()
+    highest_high = high.rolling(window=k_period).max()
+    k_percent = ((close - lowest_low) / (highest_high - lowest_low)) * 100
+    d_percent = k_percent.rolling(window=d_period).mean()
+    return k_percent, d_percent
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))))
+    high = close * (1 + rng.uniform(0, 0.02, n))
+    low = close * (1 - rng.uniform(0, 0.02, n))
+    return high, low, close
+
+
+def signal_flags(k, d):
+    # What the score and the scan act on, which have to agree exactly rather than to a tolerance.
+    above, prev_above = k > d, k.shift(1) > d.shift(1)
+    below, prev_below = k < d, k.shift(1) < d.shift(1)
+    return {'k > d': above, 'k < d': below, 'bullish cross': above & prev_below,
+            'bearish cross': below & prev_above}
+
+
+def best_of(fn, repeat):
+    runs = timeit.repeat(fn, number=1, repeat=repeat)
+    return min(runs) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the rolling min/max kernel against pandas rolling")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[252, 2520, 25_200, 252_000, 2_520_000])
+    parser.add_argument('--window', type=int, default=14)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bars':>10} {'pandas ms':>10} {'kernel ms':>10} {'speedup':>8} {'min/max ms':>11}")
+    for n in args.sizes:
+        high, low, close = series(n)
+        k_ref, d_ref = pandas_stochastic(high, low, close, args.window)
+        k_new, d_new = calculate_stochastic(high, low, close, args.window)
+        assert np.allclose(k_ref, k_new, equal_nan=True) and np.allclose(d_ref, d_new, equal_nan=True)
+        expected = signal_flags(k_ref, d_ref)
+        for name, flags in signal_flags(k_new, d_new).items():
+            assert flags.equals(expected[name]), f"{name} differs from pandas at {n} bars"
+
+        baseline = best_of(lambda: pandas_stochastic(high, low, close, args.window), args.repeat)
+        kernel = best_of(lambda: calculate_stochastic(high, low, close, args.window), args.repeat)
+        values = low.to_numpy()
+        extremes = best_of(lambda: (rolling_min(values, args.window), rolling_max(values, args.window)), args.repeat)
+        print(f"{n:>10} {baseline:>10.3f} {kernel:>10.3f} {baseline / kernel:>7.1f}x {extremes:>11.3f}")
+
+
+if __name__ == '__main__':
+    main()
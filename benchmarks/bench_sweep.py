@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_backtest import universe
+from sterncurve.sweep import DEFAULT_GRID, sweep
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Time the stochastic parameter sweep across worker counts")
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, *[2 ** i for i in range(1, cores.bit_length())], cores}))
+    args = parser.parse_args()
+
+    bulk, _ = universe(args.tickers, args.years * 252)
+    settings = (len(DEFAULT_GRID['k_period']) * len(DEFAULT_GRID['d_period'])
+                * sum(lo < hi for lo in DEFAULT_GRID['oversold'] for hi in DEFAULT_GRID['overbought']))
+    print(f"{args.tickers} tickers x {len(bulk)} bars, {settings} settings, {cores} cores")
+    print(f"{'workers':>7} {'seconds':>8} {'settings/s':>11} {'speedup':>8}")
+    baseline = None
+    ranked = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        result = sweep(bulk, workers=workers)
+        elapsed = time.perf_counter() - start
+        if ranked is not None and not result.round(12).equals(ranked.round(12)):
+            raise SystemExit(f"{workers} workers ranked the settings differently")
+        ranked = result
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>8.2f} {settings / elapsed:>11.1f} {baseline / elapsed:>7.2f}x")
+    print(ranked.head(10).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+if __name__ == '__main__':
+    main()
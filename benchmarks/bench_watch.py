@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_backtest import universe
+from sterncurve.providers import MarketDataProvider
+from sterncurve.signal_index import SignalIndex
+from sterncurve.watch import SignalWatcher
+
+
+class ReleasingProvider(MarketDataProvider):
+    # Serves a synthetic universe up to a cursor that advances one bar per cycle, with a fixed
+    # delay per bulk request standing in for the network round trip.
+    def __init__(self, bulk, start, latency):
+        self.bulk = bulk
+        self.cursor = start
+        self.latency = latency
+
+    def history(self, ticker, period=None, start=None):
+        return self.bulk_history([ticker], period)[ticker]
+
+    def info(self, ticker):
+        return {}
+
+    def bulk_history(self, tickers, period):
+        time.sleep(self.latency)
+        return self.bulk.iloc[max(0, self.cursor - 21):self.cursor][list(tickers)]
+
+
+class CountingSink:
+    def __init__(self):
+        self.alerts = 0
+
+    def send(self, alerts):
+        self.alerts += len(alerts)
+
+
+async def run(watcher, provider, cycles):
+    reports = [await watcher.cycle()]
+    for _ in range(cycles):
+        provider.cursor += 1
+        reports.append(await watcher.cycle())
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time watch cycles over a large synthetic universe")
+    parser.add_argument('--tickers', type=int, default=5000)
+    parser.add_argument('--cycles', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.5, help="seconds per bulk request")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--chunk-size', type=int, default=100)
+    args = parser.parse_args()
+
+    bulk, _ = universe(args.tickers, 60 + args.cycles)
+    tickers = list(dict.fromkeys(bulk.columns.get_level_values(0)))
+    provider = ReleasingProvider(bulk, 60, args.latency)
+    sink = CountingSink()
+    index = SignalIndex(os.path.join(tempfile.mkdtemp(prefix='sterncurve-bench-'), 'signals.db'))
+    watcher = SignalWatcher(lambda: tickers, provider, index, [sink], concurrency=args.concurrency,
+                            chunk_size=args.chunk_size)
+    reports = asyncio.run(run(watcher, provider, args.cycles))
+
+    chunks = -(-args.tickers // args.chunk_size)
+    floor = -(-chunks // args.concurrency) * args.latency
+    print(f"{args.tickers} tickers in {chunks} requests of {args.chunk_size}, {args.concurrency} in flight, "
+          f"{args.latency * 1000:.0f}ms per request (network floor {floor:.1f}s)")
+    print(f"{'cycle':<10} {'updated':>8} {'alerts':>7} {'seconds':>8} {'tickers/s':>10}")
+    for number, report in enumerate(reports):
+        label = 'baseline' if number == 0 else str(number)
+        print(f"{label:<10} {report['updated']:>8} {report['alerts']:>7} {report['duration']:>8.2f} "
+              f"{report['requested'] / report['duration']:>10.0f}")
+    print(f"{sink.alerts} alerts sent")
+
+
+if __name__ == '__main__':
+    main()
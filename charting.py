@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Above this many bars the price panel switches to coarser candles and %K/%D are decimated,
+# so the figure payload stays bounded however long the history is.
+MAX_CHART_POINTS = 1000
+
+# Candle sizes tried in order until the history fits under MAX_CHART_POINTS.
+CANDLE_RULES = [('W-MON', 'Weekly'), ('MS', 'Monthly'), ('QS', 'Quarterly'), ('YS', 'Yearly')]
+
+
+def lttb(x, y, threshold):
+    # Largest-triangle-three-buckets: keeps the first and last points and, from each bucket in
+    # between, the point forming the largest triangle with the previously kept point and the
+    # next bucket's mean. Returns the indices of the kept points.
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+        area = np.abs((x[previous] - mean_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (mean_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        kept[i + 1] = previous
+    return kept
+
+def decimate_series(series, threshold=MAX_CHART_POINTS):
+    series = series.dropna()
+    if len(series) <= threshold:
+        return series
+    x = series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(series))
+    return series.iloc[lttb(x, series.to_numpy(), threshold)]
+
+def aggregate_candles(data, max_bars=MAX_CHART_POINTS):
+    # Returns (ohlc, label); label is None when the bars are shown as they are.
+    if len(data) <= max_bars:
+        return data, None
+    for rule, label in CANDLE_RULES:
+        grouped = data.resample(rule, label='left', closed='left')
+        ohlc = pd.DataFrame({
+            'Open': grouped['Open'].first(),
+            'High': grouped['High'].max(),
+            'Low': grouped['Low'].min(),
+            'Close': grouped['Close'].last()
+        }).dropna(subset=['Close'])
+        if len(ohlc) <= max_bars:
+            return ohlc, label
+    return ohlc, label
+
+def stochastic_figure(data, ticker, max_points=MAX_CHART_POINTS):
+    candles, candle_label = aggregate_candles(data, max_points)
+    decimated = len(data) > max_points
+    line = go.Scattergl if decimated else go.Scatter
+    title = f'{ticker} Price' + (f' ({candle_label.lower()} candles)' if candle_label else '')
+
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.7, 0.3], vertical_spacing=0.03,
+                        subplot_titles=(title, 'Stochastic Oscillator'))
+
+    fig.add_trace(go.Candlestick(x=candles.index, open=candles['Open'], high=candles['High'],
+                                  low=candles['Low'], close=candles['Close'], name='Price'), row=1, col=1)
+
+    k = decimate_series(data['STOCH_K'], max_points) if decimated else data['STOCH_K']
+    d = decimate_series(data['STOCH_D'], max_points) if decimated else data['STOCH_D']
+    fig.add_trace(line(x=k.index, y=k, line=dict(color='orange', width=2), name='%K'), row=2, col=1)
+    fig.add_trace(line(x=d.index, y=d, line=dict(color='black', width=2), name='%D'), row=2, col=1)
+
+    fig.update_yaxes(range=[-10, 110], row=2, col=1)
+    fig.add_hline(y=0, col=1, row=2, line_color="gray", line_width=2)
+    fig.add_hline(y=100, col=1, row=2, line_color="gray", line_width=2)
+    fig.add_hline(y=20, col=1, row=2, line_color='blue', line_width=2, line_dash='dash')
+    fig.add_hline(y=80, col=1, row=2, line_color='blue', line_width=2, line_dash='dash')
+
+    fig.update_layout(height=800, xaxis=dict(rangeslider=dict(visible=False)), showlegend=True, hovermode='x unified')
+    return fig
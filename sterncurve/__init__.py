@@ -0,0 +1,41 @@
+import importlib
+
+# The calculation and data layers behind the app, usable without Streamlit or Plotly. Names are
+# resolved on first access, so `import sterncurve` stays cheap and each submodule (with pandas,
+# yfinance or multiprocessing behind it) only loads when something from it is used.
+_EXPORTS = {
+    'calculate_stochastic': 'stochastic',
+    'calculate_stochastic_score': 'stochastic',
+    'scan_stochastic': 'stochastic',
+    'stochastic_matrix': 'stochastic',
+    'StochasticState': 'stochastic',
+    'analyze_fundamentals': 'fundamentals',
+    'score_fundamentals': 'fundamentals',
+    'fundamentals_frame': 'fundamentals',
+    'classify_sector': 'fundamentals',
+    'AnalysisReport': 'report',
+    'scan_universe': 'screener',
+    'load_universe': 'screener',
+    'get_prospective_stocks': 'screener',
+    'summarize': 'backtest',
+    'get_provider': 'providers',
+    'FetchExecutor': 'fetcher',
+    'PriceStore': 'price_store',
+    'PortfolioStore': 'portfolio_store',
+    'SignalIndex': 'signal_index',
+    'SymbolIndex': 'symbols'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'sterncurve' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f'sterncurve.{_EXPORTS[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,30 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+
+class SQLiteStore:
+    # Base of the SQLite-backed stores. A file database gets its directory created and a short-lived
+    # connection per operation; ':memory:' keeps one shared connection, since every new connection
+    # to it would open a separate, empty database. Subclasses list their CREATE statements in
+    # SCHEMA and serialize access with their own lock.
+    SCHEMA = ()
+
+    def __init__(self, path):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._memory_conn = sqlite3.connect(path, check_same_thread=False) if path == ':memory:' else None
+        with self._connection() as conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connection(self):
+        conn = self._memory_conn or sqlite3.connect(self.path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            if conn is not self._memory_conn:
+                conn.close()
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+from sterncurve.stochastic import OVERBOUGHT, OVERSOLD, stochastic_matrix
+
+# Signal name -> trade direction: +1 goes long on the signal bar's close, -1 goes short.
+SIGNALS = {
+    'oversold': 1,
+    'overbought': -1,
+    'bullish_cross': 1,
+    'bearish_cross': -1
+}
+
+DEFAULT_HOLD = 10
+DEFAULT_HORIZONS = (5, 10, 20)
+
+EXIT_HOLD = 'hold'
+EXIT_STOP = 'stop'
+EXIT_TARGET = 'target'
+
+
+def price_matrices(bulk):
+    # bulk: wide frame with (ticker, field) columns, as returned by bulk_history().
+    # Returns (tickers, dates, {field: (bars, tickers) array}) aligned on the frame's dates.
+    tickers = list(dict.fromkeys(bulk.columns.get_level_values(0)))
+    prices = {field: bulk.xs(field, axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+              for field in ('Open', 'High', 'Low', 'Close')}
+    return tickers, bulk.index, prices
+
+
+def signal_events(k, d, oversold=OVERSOLD, overbought=OVERBOUGHT):
+    # Boolean (bars, tickers) masks of the bars where each signal fires. Oversold/overbought fire
+    # on the bar %K enters the zone rather than on every bar spent in it, and the *_exit events
+    # on the bar it leaves. NaN comparisons are False, so warm-up bars and gaps never fire.
+    prev_k = np.vstack([np.full((1,) + k.shape[1:], np.nan), k[:-1]])
+    prev_d = np.vstack([np.full((1,) + d.shape[1:], np.nan), d[:-1]])
+    return {
+        'oversold': (prev_k >= oversold) & (k < oversold),
+        'overbought': (prev_k <= overbought) & (k > overbought),
+        'bullish_cross': (prev_k <= prev_d) & (k > d),
+        'bearish_cross': (prev_k >= prev_d) & (k < d),
+        'oversold_exit': (prev_k < oversold) & (k >= oversold),
+        'overbought_exit': (prev_k > overbought) & (k <= overbought)
+    }
+
+
+def simulate_trades(rows, cols, direction, prices, hold=DEFAULT_HOLD, stop_loss=None, take_profit=None,
+                    horizons=DEFAULT_HORIZONS):
+    # Every event is an independent trade entered at the signal bar's close and held up to `hold`
+    # bars. A stop or target is checked against each bar's low/high and fills at its level, or at
+    # the open when the bar gaps through it; a bar that touches both counts as stopped. Trades
+    # without a full holding window of prices are dropped. Returns, forward returns and drawdowns
+    # are signed by the direction, so positive always means the signal was right.
+    opens, highs, lows, closes = (prices[field] for field in ('Open', 'High', 'Low', 'Close'))
+    bars = len(closes)
+    rows = np.asarray(rows)
+    cols = np.asarray(cols)
+    direction = np.broadcast_to(np.asarray(direction, dtype=float), rows.shape)
+    path = rows[:, None] + np.arange(1, hold + 1)
+    inside = path < bars
+    path = np.minimum(path, bars - 1)
+    column = cols[:, None]
+    entry = closes[rows, cols]
+    close_path = closes[path, column]
+    complete = inside.all(axis=1) & ~np.isnan(entry) & ~np.isnan(close_path).any(axis=1)
+
+    rows, cols, direction = rows[complete], cols[complete], direction[complete]
+    path, entry = path[complete], entry[complete]
+    column = cols[:, None]
+    long = direction[:, None] > 0
+    open_path = opens[path, column] / entry[:, None] - 1
+    high_path = highs[path, column] / entry[:, None] - 1
+    low_path = lows[path, column] / entry[:, None] - 1
+    close_path = closes[path, column] / entry[:, None] - 1
+    # Signed so that "favorable" is always up: best is the bar's best excursion, worst its worst.
+    best = np.where(long, high_path, -low_path)
+    worst = np.where(long, low_path, -high_path)
+    opened = np.where(long, open_path, -open_path)
+
+    stop_hit = np.zeros(path.shape, dtype=bool) if stop_loss is None else worst <= -stop_loss
+    target_hit = np.zeros(path.shape, dtype=bool) if take_profit is None else best >= take_profit
+    exit_hit = stop_hit | target_hit
+    exited = exit_hit.any(axis=1)
+    exit_bar = np.where(exited, exit_hit.argmax(axis=1), hold - 1)
+    trade = np.arange(len(rows))
+    stopped = exited & stop_hit[trade, exit_bar]
+    targeted = exited & ~stopped
+    gap = opened[trade, exit_bar]
+    returns = np.where(long[:, 0], close_path[trade, exit_bar], -close_path[trade, exit_bar])
+    if stop_loss is not None:
+        returns = np.where(stopped, np.minimum(gap, -stop_loss), returns)
+    if take_profit is not None:
+        returns = np.where(targeted, np.maximum(gap, take_profit), returns)
+
+    # Worst signed excursion up to the exit; on a stopped bar the position is gone at the fill.
+    excursion = np.where(np.arange(hold) <= exit_bar[:, None], worst, np.inf)
+    excursion[trade, exit_bar] = np.where(stopped, returns, excursion[trade, exit_bar])
+    drawdown = np.minimum(excursion.min(axis=1), 0.0)
+
+    forward = {}
+    for horizon in horizons:
+        ahead = rows + horizon
+        later = closes[np.minimum(ahead, bars - 1), cols]
+        change = np.where(ahead < bars, later / entry - 1, np.nan)
+        forward[horizon] = direction * change
+
+    return {
+        'row': rows,
+        'col': cols,
+        'exit_row': rows + exit_bar + 1,
+        'entry': entry,
+        'return': returns,
+        'drawdown': drawdown,
+        'exit': np.where(stopped, EXIT_STOP, np.where(targeted, EXIT_TARGET, EXIT_HOLD)),
+        'forward': forward
+    }
+
+
+def backtest(bulk, k_period=14, d_period=3, oversold=OVERSOLD, overbought=OVERBOUGHT, hold=DEFAULT_HOLD,
+             stop_loss=None, take_profit=None, horizons=DEFAULT_HORIZONS, signals=None, sectors=None):
+    # One row per simulated trade across every ticker in the bulk frame. stop_loss/take_profit
+    # are fractions of the entry price (0.05 = 5%); sectors maps ticker -> sector label.
+    columns = ['ticker', 'sector', 'signal', 'date', 'exit_date', 'entry', 'return', 'hit', 'drawdown',
+               'exit'] + [f'fwd_{h}' for h in horizons]
+    if bulk is None or bulk.empty:
+        return pd.DataFrame(columns=columns)
+
+    tickers, dates, prices = price_matrices(bulk)
+    k, d = stochastic_matrix(prices['High'], prices['Low'], prices['Close'], k_period, d_period)
+    events = signal_events(k, d, oversold, overbought)
+
+    frames = []
+    for name in signals or SIGNALS:
+        rows, cols = np.nonzero(events[name])
+        trades = simulate_trades(rows, cols, SIGNALS[name], prices, hold, stop_loss, take_profit, horizons)
+        ticker = np.asarray(tickers, dtype=object)[trades['col']]
+        frame = pd.DataFrame({
+            'ticker': ticker,
+            'sector': [sectors.get(t, 'Other') for t in ticker] if sectors else 'Other',
+            'signal': name,
+            'date': dates[trades['row']],
+            'exit_date': dates[trades['exit_row']],
+            'entry': trades['entry'],
+            'return': trades['return'],
+            'hit': trades['return'] > 0,
+            'drawdown': trades['drawdown'],
+            'exit': trades['exit']
+        })
+        for horizon in horizons:
+            frame[f'fwd_{horizon}'] = trades['forward'][horizon]
+        frames.append(frame)
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True).sort_values(['date', 'ticker'], kind='stable',
+                                                            ignore_index=True)[columns]
+
+
+def summarize(trades, by=('ticker', 'signal')):
+    # Hit rate, mean/median trade return, mean forward returns and drawdowns per group.
+    by = [by] if isinstance(by, str) else list(by)
+    forward = [column for column in trades.columns if column.startswith('fwd_')]
+    grouped = trades.assign(stopped=trades['exit'] == EXIT_STOP).groupby(by, sort=True)
+    summary = grouped.agg(
+        trades=('return', 'size'),
+        hit_rate=('hit', 'mean'),
+        avg_return=('return', 'mean'),
+        median_return=('return', 'median'),
+        avg_drawdown=('drawdown', 'mean'),
+        max_drawdown=('drawdown', 'min'),
+        stopped=('stopped', 'mean')
+    )
+    for column in forward:
+        summary[f'avg_{column}'] = grouped[column].mean()
+    return summary.reset_index()
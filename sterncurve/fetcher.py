@@ -0,0 +1,59 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_MAX_WORKERS = int(os.environ.get('STERNCURVE_FETCH_WORKERS', 8))
+DEFAULT_REQUESTS_PER_SECOND = float(os.environ.get('STERNCURVE_FETCH_RPS', 5))
+
+
+class RateLimiter:
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchExecutor:
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, requests_per_second=DEFAULT_REQUESTS_PER_SECOND):
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(requests_per_second)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+
+    def _call(self, fn, item):
+        self.limiter.acquire()
+        return fn(item)
+
+    def map(self, fn, items, on_progress=None):
+        # Returns {item: (result, error)}; on_progress(done, total, item) runs in the calling thread.
+        items = list(items)
+        results = {}
+        futures = {self.pool.submit(self._call, fn, item): item for item in items}
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            try:
+                results[item] = (future.result(), None)
+            except Exception as e:
+                results[item] = (None, str(e))
+            if on_progress:
+                on_progress(done, len(items), item)
+        return results
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,444 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Metric name -> (info key, multiplier). Missing and zero values both count as absent, matching
+# the truthiness checks the sector rules were written against.
+METRICS = {
+    'pe_ratio': ('trailingPE', 1),
+    'roe': ('returnOnEquity', 100),
+    'pb_ratio': ('priceToBook', 1),
+    'book_value': ('bookValue', 1),
+    'revenue_growth': ('revenueGrowth', 100),
+    'gross_margin': ('grossMargins', 100),
+    'operating_margin': ('operatingMargins', 100),
+    'profit_margin': ('profitMargins', 100),
+    'dividend_yield': ('dividendYield', 100),
+    'payout_ratio': ('payoutRatio', 100),
+    'debt_to_equity': ('debtToEquity', 1),
+    'free_cash_flow': ('freeCashflow', 1),
+    'operating_cash_flow': ('operatingCashflow', 1)
+}
+
+DISPLAY_FORMATS = {
+    'ratio': lambda v: f"{v:.2f}",
+    'percent': lambda v: f"{v:.1f}%",
+    'yield': lambda v: f"{v:.2f}%",
+    'dollars': lambda v: f"${v:.2f}",
+    'billions': lambda v: f"${v/1e9:.2f}B"
+}
+
+# Each rule is (metric, branches); the first matching branch applies. A branch is
+# (op, bound, delta, message): positive deltas are strengths, negative ones weaknesses.
+SECTOR_PROFILES = {
+    'Financial Services': {
+        'drivers': ['Interest rates', 'Loan growth', 'Credit quality', 'Regulation'],
+        'peer_examples': ['JPM', 'BAC', 'GS', 'WFC', 'BRK-B'],
+        'what_to_look_for': ['Growing deposits', 'Stable loan portfolio', 'Good risk management'],
+        'metrics': [
+            ('P/E Ratio', 'pe_ratio', 'ratio'),
+            ('ROE (Return on Equity)', 'roe', 'percent'),
+            ('Price-to-Book (P/B)', 'pb_ratio', 'ratio'),
+            ('Book Value per Share', 'book_value', 'dollars')
+        ],
+        'rules': [
+            ('roe', [
+                ('>', 15, 20, "Strong ROE of {:.1f}% - Efficient use of capital"),
+                ('>', 10, 10, "Adequate ROE of {:.1f}%"),
+                ('<', 8, -15, "Low ROE of {:.1f}% - Inefficient capital deployment")
+            ]),
+            ('pb_ratio', [
+                ('<', 1.0, 15, "Attractive P/B of {:.2f} - Trading below book value"),
+                ('<', 1.5, 10, "Reasonable P/B of {:.2f}"),
+                ('>', 3, -15, "High P/B of {:.2f} - May be overvalued")
+            ]),
+            ('pe_ratio', [
+                ('<', 12, 5, "Low P/E of {:.2f} - Potential value"),
+                ('>', 20, -5, "High P/E of {:.2f} - May be expensive")
+            ])
+        ]
+    },
+    'Technology': {
+        'drivers': ['Innovation cycles', 'AI growth', 'Cloud adoption', 'Consumer demand'],
+        'peer_examples': ['AAPL', 'NVDA', 'MSFT', 'AMD', 'ADBE'],
+        'what_to_look_for': ['Scalable software models', 'High customer retention', 'IP moats and competitive advantages'],
+        'metrics': [
+            ('P/E Ratio', 'pe_ratio', 'ratio'),
+            ('Revenue Growth (YoY)', 'revenue_growth', 'percent'),
+            ('Gross Margin', 'gross_margin', 'percent'),
+            ('Free Cash Flow', 'free_cash_flow', 'billions')
+        ],
+        'rules': [
+            ('revenue_growth', [
+                ('>', 20, 25, "Exceptional revenue growth of {:.1f}%"),
+                ('>', 15, 20, "Strong revenue growth of {:.1f}%"),
+                ('>', 10, 10, "Solid revenue growth of {:.1f}%"),
+                ('<', 5, -20, "Slow revenue growth of {:.1f}%")
+            ]),
+            ('gross_margin', [
+                ('>', 70, 20, "Excellent gross margin of {:.1f}% - Strong competitive advantage"),
+                ('>', 60, 15, "High gross margin of {:.1f}%"),
+                ('<', 40, -15, "Low gross margin of {:.1f}% - Limited pricing power")
+            ]),
+            ('free_cash_flow', [
+                ('>', 5e9, 15, "Strong free cash flow generation"),
+                ('>', 0, 10, "Positive free cash flow"),
+                ('any', None, -10, "Negative free cash flow")
+            ])
+        ]
+    },
+    'Industrial': {
+        'drivers': ['Economic growth', 'Infrastructure spending', 'Supply chain health'],
+        'peer_examples': ['BA', 'CAT', 'GE', 'HON', 'RTX'],
+        'what_to_look_for': ['Operational efficiency', 'Diversified client base', 'Government contracts'],
+        'metrics': [
+            ('Operating Margin', 'operating_margin', 'percent'),
+            ('Debt-to-Equity', 'debt_to_equity', 'ratio'),
+            ('Free Cash Flow', 'free_cash_flow', 'billions'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('operating_margin', [
+                ('>', 15, 20, "Strong operating margin of {:.1f}%"),
+                ('>', 10, 10, "Healthy operating margin of {:.1f}%"),
+                ('<', 5, -15, "Low operating margin of {:.1f}%")
+            ]),
+            ('debt_to_equity', [
+                ('<', 50, 15, "Low debt-to-equity of {:.2f} - Strong balance sheet"),
+                ('>', 150, -20, "High debt-to-equity of {:.2f} - Leverage risk")
+            ]),
+            ('free_cash_flow', [
+                ('>', 0, 15, "Positive free cash flow - Financial stability")
+            ])
+        ]
+    },
+    'Energy': {
+        'drivers': ['Commodity prices (oil, natural gas)', 'Geopolitical factors', 'OPEC decisions'],
+        'peer_examples': ['XOM', 'CVX', 'COP', 'SLB', 'NEE'],
+        'what_to_look_for': ['Low-cost producers', 'Strong reserves', 'Diversification into renewables'],
+        'metrics': [
+            ('Price-to-Book (P/B)', 'pb_ratio', 'ratio'),
+            ('Debt-to-Equity', 'debt_to_equity', 'ratio'),
+            ('Free Cash Flow', 'free_cash_flow', 'billions'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('pb_ratio', [
+                ('<', 1.5, 15, "Attractive P/B of {:.2f}"),
+                ('>', 3, -10, "High P/B of {:.2f}")
+            ]),
+            ('debt_to_equity', [
+                ('<', 40, 20, "Low debt-to-equity of {:.2f}"),
+                ('>', 100, -15, "High debt-to-equity of {:.2f}")
+            ]),
+            ('free_cash_flow', [
+                ('>', 2e9, 15, "Strong free cash flow coverage")
+            ])
+        ]
+    },
+    'Real Estate': {
+        'drivers': ['Interest rates', 'Occupancy rates', 'Property values'],
+        'peer_examples': ['PLD', 'O', 'SPG', 'AMT'],
+        'what_to_look_for': ['Quality assets', 'Low leverage', 'Stable rental income'],
+        'metrics': [
+            ('Dividend Yield', 'dividend_yield', 'yield'),
+            ('Payout Ratio', 'payout_ratio', 'percent'),
+            ('Debt-to-Equity', 'debt_to_equity', 'ratio'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('dividend_yield', [
+                ('>', 4, 20, "Attractive dividend yield of {:.2f}%"),
+                ('>', 3, 10, "Solid dividend yield of {:.2f}%")
+            ]),
+            ('payout_ratio', [
+                ('between', (50, 80), 15, "Sustainable payout ratio of {:.1f}%"),
+                ('>', 90, -15, "High payout ratio of {:.1f}% - Dividend risk")
+            ]),
+            ('debt_to_equity', [
+                ('<', 100, 15, "Manageable debt-to-equity of {:.2f}"),
+                ('>', 200, -20, "High debt-to-equity of {:.2f}")
+            ])
+        ]
+    },
+    'Consumer Cyclical': {
+        'drivers': ['Consumer confidence', 'Disposable income', 'Inflation'],
+        'peer_examples': ['AMZN', 'TSLA', 'NKE', 'MCD', 'DIS'],
+        'what_to_look_for': ['Strong brands', 'Pricing power', 'Global presence'],
+        'metrics': [
+            ('P/E Ratio', 'pe_ratio', 'ratio'),
+            ('Gross Margin', 'gross_margin', 'percent'),
+            ('Revenue Growth', 'revenue_growth', 'percent')
+        ],
+        'rules': [
+            ('gross_margin', [
+                ('>', 40, 20, "Strong gross margin of {:.1f}% - Pricing power"),
+                ('<', 25, -15, "Low gross margin of {:.1f}%")
+            ]),
+            ('revenue_growth', [
+                ('>', 10, 15, "Solid revenue growth of {:.1f}%"),
+                ('<', 0, -20, "Negative revenue growth of {:.1f}%")
+            ])
+        ]
+    },
+    'Consumer Defensive': {
+        'drivers': ['Defensive sector - steady demand', 'Economic resilience', 'Brand loyalty'],
+        'peer_examples': ['PG', 'KO', 'PEP', 'COST', 'WMT'],
+        'what_to_look_for': ['Consistent earnings', 'Loyal customer base', 'Pricing resilience'],
+        'metrics': [
+            ('Revenue Growth', 'revenue_growth', 'percent'),
+            ('Dividend Yield', 'dividend_yield', 'yield'),
+            ('Operating Margin', 'operating_margin', 'percent'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('revenue_growth', [
+                ('>', 3, 15, "Stable revenue growth of {:.1f}%")
+            ]),
+            ('dividend_yield', [
+                ('>', 3, 20, "Attractive dividend yield of {:.2f}%"),
+                ('>', 2, 10, "Solid dividend yield of {:.2f}%")
+            ]),
+            ('operating_margin', [
+                ('>', 15, 15, "Strong operating margin of {:.1f}%")
+            ])
+        ]
+    },
+    'Communication Services': {
+        'drivers': ['Ad revenue', 'Subscriptions', 'Data usage', 'Competition'],
+        'peer_examples': ['GOOGL', 'META', 'NFLX', 'VZ', 'T'],
+        'what_to_look_for': ['Scale advantage', 'Diverse revenue streams', 'Global footprint'],
+        'metrics': [
+            ('Revenue Growth', 'revenue_growth', 'percent'),
+            ('Operating Margin', 'operating_margin', 'percent'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('revenue_growth', [
+                ('>', 15, 20, "Strong revenue growth of {:.1f}%"),
+                ('<', 5, -15, "Slow revenue growth of {:.1f}%")
+            ]),
+            ('operating_margin', [
+                ('>', 25, 20, "Excellent operating margin of {:.1f}%"),
+                ('<', 10, -15, "Low operating margin of {:.1f}%")
+            ])
+        ]
+    },
+    'Basic Materials': {
+        'drivers': ['Commodity cycles', 'Construction demand', 'Inflation trends'],
+        'peer_examples': ['DOW', 'DD', 'FCX', 'NUE', 'LIN'],
+        'what_to_look_for': ['Cost leadership', 'Vertical integration', 'Low leverage'],
+        'metrics': [
+            ('Gross Margin', 'gross_margin', 'percent'),
+            ('Operating Cash Flow', 'operating_cash_flow', 'billions'),
+            ('Debt-to-Equity', 'debt_to_equity', 'ratio'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('gross_margin', [
+                ('>', 30, 15, "Strong gross margin of {:.1f}%"),
+                ('<', 15, -10, "Low gross margin of {:.1f}% - Cyclical pressure")
+            ]),
+            ('operating_cash_flow', [
+                ('>', 1e9, 15, "Solid operating cash flow generation")
+            ]),
+            ('debt_to_equity', [
+                ('<', 50, 20, "Low debt-to-equity of {:.2f}"),
+                ('>', 100, -15, "High debt-to-equity of {:.2f}")
+            ])
+        ]
+    },
+    'Utilities': {
+        'drivers': ['Regulation', 'Energy demand', 'Rate adjustments'],
+        'peer_examples': ['DUK', 'D', 'NEE', 'SO', 'AEP'],
+        'what_to_look_for': ['Stable cash flow', 'Dividend reliability', 'Green transition initiatives'],
+        'metrics': [
+            ('Dividend Yield', 'dividend_yield', 'yield'),
+            ('Payout Ratio', 'payout_ratio', 'percent'),
+            ('Debt-to-Equity', 'debt_to_equity', 'ratio'),
+            ('P/E Ratio', 'pe_ratio', 'ratio')
+        ],
+        'rules': [
+            ('dividend_yield', [
+                ('>', 4, 20, "Attractive dividend yield of {:.2f}%"),
+                ('>', 3, 10, "Solid dividend yield of {:.2f}%")
+            ]),
+            ('payout_ratio', [
+                ('between', (50, 75), 15, "Sustainable payout ratio of {:.1f}%"),
+                ('>', 85, -10, "High payout ratio of {:.1f}%")
+            ]),
+            ('debt_to_equity', [
+                ('>', 150, -5, "High debt-to-equity of {:.2f} - Capital intensive")
+            ])
+        ]
+    }
+}
+
+DEFAULT_PROFILE = {
+    'drivers': [],
+    'peer_examples': [],
+    'what_to_look_for': [],
+    'metrics': [
+        ('P/E Ratio', 'pe_ratio', 'ratio'),
+        ('Profit Margin', 'profit_margin', 'percent')
+    ],
+    'rules': [
+        ('profit_margin', [
+            ('>', 10, 10, "Healthy profit margin of {:.1f}%")
+        ])
+    ]
+}
+
+# Sector classification rules in precedence order: the first rule with a keyword found in the
+# lowercased sector or industry string wins.
+SECTOR_KEYWORDS = [
+    ('Financial Services', ['financial'], ['bank', 'insurance', 'credit']),
+    ('Technology', ['technology', 'information technology'], ['software', 'semiconductor']),
+    ('Industrial', ['industrial'], ['aerospace', 'defense', 'machinery', 'construction']),
+    ('Energy', ['energy'], ['oil', 'gas', 'petroleum']),
+    ('Real Estate', ['real estate'], ['reit']),
+    ('Consumer Cyclical', ['consumer cyclical'], ['retail', 'automotive', 'apparel', 'travel']),
+    ('Consumer Defensive', ['consumer defensive', 'consumer staples'], ['food', 'beverage', 'household']),
+    ('Communication Services', ['communication'], ['media', 'telecom', 'entertainment']),
+    ('Basic Materials', ['basic materials', 'materials'], ['chemical', 'metal', 'mining']),
+    ('Utilities', ['utilities'], ['utility', 'electric'])
+]
+
+RECOMMENDATIONS = [(75, "Strong Buy"), (65, "Buy"), (50, "Hold"), (40, "Underperform")]
+BASE_SCORE = 50
+
+
+def _keyword_matcher(field):
+    # One alternation per field wrapped in a lookahead, so every keyword occurrence is reported
+    # even when occurrences overlap; each maps back to the rule index it belongs to.
+    ranks = {}
+    for rank, (sector, sector_keywords, industry_keywords) in enumerate(SECTOR_KEYWORDS):
+        for keyword in (sector_keywords, industry_keywords)[field]:
+            ranks.setdefault(keyword, rank)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in sorted(ranks, key=ranks.get)) + '))')
+    return pattern, ranks
+
+_SECTOR_MATCHER = _keyword_matcher(0)
+_INDUSTRY_MATCHER = _keyword_matcher(1)
+
+def _best_rank(text, matcher):
+    pattern, ranks = matcher
+    return min((ranks[m.group(1)] for m in pattern.finditer(text)), default=len(SECTOR_KEYWORDS))
+
+@lru_cache(maxsize=4096)
+def classify_sector(sector, industry):
+    rank = min(_best_rank(sector.lower(), _SECTOR_MATCHER), _best_rank(industry.lower(), _INDUSTRY_MATCHER))
+    return SECTOR_KEYWORDS[rank][0] if rank < len(SECTOR_KEYWORDS) else 'Other'
+
+def classify_sectors(sectors, industries):
+    # Batch form: classifies each distinct (sector, industry) pair once and broadcasts the result.
+    pairs = pd.MultiIndex.from_arrays([pd.Series(list(sectors), dtype=object).fillna(''),
+                                       pd.Series(list(industries), dtype=object).fillna('')])
+    codes, uniques = pairs.factorize()
+    labels = np.array([classify_sector(sector, industry) for sector, industry in uniques], dtype=object)
+    return labels[codes]
+
+def get_sector_from_info(info):
+    return classify_sector(info.get('sector', ''), info.get('industry', ''))
+
+def metric_values(info):
+    # One row of metric values for an info dict; absent (missing, None or zero) values are NaN.
+    values = {}
+    for metric, (key, multiplier) in METRICS.items():
+        value = info.get('trailingPE', info.get('forwardPE')) if metric == 'pe_ratio' else info.get(key)
+        try:
+            values[metric] = float(value) * multiplier if value else np.nan
+        except (TypeError, ValueError):
+            values[metric] = np.nan
+    return values
+
+def fundamentals_frame(infos):
+    # {ticker: info} -> DataFrame of metric values indexed by ticker.
+    return pd.DataFrame([metric_values(info) for info in infos.values()], index=list(infos),
+                        columns=list(METRICS), dtype=float)
+
+def _condition(values, op, bound):
+    if op == '>':
+        return values > bound
+    if op == '<':
+        return values < bound
+    if op == 'between':
+        return (values > bound[0]) & (values < bound[1])
+    if op == 'any':
+        return np.ones(values.shape, dtype=bool)
+    raise ValueError(f"Unknown rule operator: {op}")
+
+def _branch_hits(values, branches):
+    # Index of the first matching branch per row, -1 where the metric is absent or nothing matches.
+    present = ~np.isnan(values)
+    conditions = [present & _condition(values, op, bound) for op, bound, delta, message in branches]
+    return np.select(conditions, np.arange(len(branches)), -1)
+
+def _score_rows(columns, profile, details=False):
+    # columns: {metric: float array} for rows sharing one sector profile.
+    rows = len(next(iter(columns.values())))
+    score = np.full(rows, BASE_SCORE)
+    strengths = [[] for _ in range(rows)] if details else None
+    weaknesses = [[] for _ in range(rows)] if details else None
+    for metric, branches in profile['rules']:
+        hits = _branch_hits(columns[metric], branches)
+        deltas = np.array([delta for op, bound, delta, message in branches] + [0])
+        score += deltas[hits]
+        if details:
+            for row in np.flatnonzero(hits >= 0):
+                op, bound, delta, message = branches[hits[row]]
+                target = strengths if delta > 0 else weaknesses
+                target[row].append(message.format(columns[metric][row]))
+    return np.clip(score, 0, 100), strengths, weaknesses
+
+def recommendations(ratings):
+    ratings = np.asarray(ratings)
+    return np.select([ratings >= threshold for threshold, label in RECOMMENDATIONS],
+                     [label for threshold, label in RECOMMENDATIONS], "Sell")
+
+def score_fundamentals(frame, sectors, details=False):
+    # Scores every row of a fundamentals_frame in one pass per sector. sectors is a sequence or
+    # Series aligned with the frame. With details=True the strengths/weaknesses lists are built too.
+    sectors = pd.Series(list(sectors), index=frame.index, dtype=object)
+    ratings = np.full(len(frame), BASE_SCORE)
+    strengths = [[] for _ in range(len(frame))]
+    weaknesses = [[] for _ in range(len(frame))]
+    for sector in sectors.unique():
+        rows = np.flatnonzero((sectors == sector).to_numpy())
+        profile = SECTOR_PROFILES.get(sector, DEFAULT_PROFILE)
+        columns = {metric: frame[metric].to_numpy(dtype=float)[rows] for metric in METRICS}
+        score, sector_strengths, sector_weaknesses = _score_rows(columns, profile, details)
+        ratings[rows] = score
+        if details:
+            for i, row in enumerate(rows):
+                strengths[row] = sector_strengths[i]
+                weaknesses[row] = sector_weaknesses[i]
+    result = pd.DataFrame({'sector': sectors, 'rating': ratings, 'recommendation': recommendations(ratings)},
+                          index=frame.index)
+    if details:
+        result['strengths'] = strengths
+        result['weaknesses'] = weaknesses
+    return result
+
+def analyze_fundamentals(info, sector):
+    profile = SECTOR_PROFILES.get(sector, DEFAULT_PROFILE)
+    values = metric_values(info)
+    columns = {metric: np.array([value]) for metric, value in values.items()}
+    score, strengths, weaknesses = _score_rows(columns, profile, details=True)
+    rating = int(score[0])
+    return {
+        'sector': sector,
+        'metrics': {
+            label: DISPLAY_FORMATS[display](values[metric]) if not np.isnan(values[metric]) else 'N/A'
+            for label, metric, display in profile['metrics']
+        },
+        'strengths': strengths[0],
+        'weaknesses': weaknesses[0],
+        'rating': rating,
+        'recommendation': str(recommendations([rating])[0]),
+        'drivers': list(profile['drivers']),
+        'what_to_look_for': list(profile['what_to_look_for']),
+        'peer_examples': list(profile['peer_examples'])
+    }
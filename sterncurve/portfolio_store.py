@@ -0,0 +1,102 @@
+import os
+import threading
+
+from sterncurve._sqlite import SQLiteStore
+from sterncurve.price_store import DATA_DIR
+
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, 'portfolio.db')
+
+FIELDS = ['ticker', 'stoch_k', 'stoch_d', 'momentum', 'trend', 'position', 'last_updated']
+
+
+class PortfolioStore(SQLiteStore):
+    # Holdings persisted in SQLite with an in-memory index keyed by ticker, so membership checks
+    # and updates are O(1) and every session in the process sees the same portfolio.
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS holdings ("
+        "ticker TEXT PRIMARY KEY, stoch_k REAL, stoch_d REAL, momentum REAL, "
+        "trend TEXT, position TEXT, last_updated TEXT)",
+    )
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.lock = threading.RLock()
+        super().__init__(path)
+        self.reload()
+
+    def reload(self):
+        with self.lock, self._connection() as conn:
+            rows = conn.execute(f"SELECT {', '.join(FIELDS)} FROM holdings ORDER BY rowid").fetchall()
+            self._index = {row[0]: dict(zip(FIELDS, row)) for row in rows}
+
+    def __contains__(self, ticker):
+        with self.lock:
+            return ticker in self._index
+
+    def __len__(self):
+        with self.lock:
+            return len(self._index)
+
+    def get(self, ticker):
+        with self.lock:
+            holding = self._index.get(ticker)
+            return dict(holding) if holding else None
+
+    def tickers(self):
+        with self.lock:
+            return set(self._index)
+
+    def all(self):
+        with self.lock:
+            return [dict(holding) for holding in self._index.values()]
+
+    def upsert_many(self, holdings):
+        # One transaction for the whole batch; returns the tickers that were newly added.
+        holdings = [{field: holding.get(field) for field in FIELDS} for holding in holdings]
+        with self.lock, self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO holdings (ticker, stoch_k, stoch_d, momentum, trend, position, last_updated) "
+                "VALUES (:ticker, :stoch_k, :stoch_d, :momentum, :trend, :position, :last_updated) "
+                "ON CONFLICT(ticker) DO UPDATE SET stoch_k = excluded.stoch_k, stoch_d = excluded.stoch_d, "
+                "momentum = excluded.momentum, trend = excluded.trend, position = excluded.position, "
+                "last_updated = excluded.last_updated",
+                holdings
+            )
+            added = [h['ticker'] for h in holdings if h['ticker'] not in self._index]
+            for holding in holdings:
+                self._index[holding['ticker']] = holding
+        return added
+
+    def apply_signals(self, signals, last_updated):
+        # signals: scan_stochastic rows for some of the holdings. Updates their readings in one
+        # batch and returns (tickers whose readings changed, tickers without a signal row).
+        signals = signals.set_index('ticker')
+        changed = set()
+        refreshed = []
+        missing = []
+        for stock in self.all():
+            if stock['ticker'] not in signals.index:
+                missing.append(stock['ticker'])
+                continue
+            row = signals.loc[stock['ticker']]
+            updated = {
+                'stoch_k': float(row['stoch_k']),
+                'stoch_d': float(row['stoch_d']),
+                'momentum': float(row['momentum']),
+                'trend': row['trend'],
+                'position': row['position']
+            }
+            if any(stock.get(key) != value for key, value in updated.items()):
+                changed.add(stock['ticker'])
+            stock.update(updated)
+            stock['last_updated'] = last_updated
+            refreshed.append(stock)
+        self.upsert_many(refreshed)
+        return changed, missing
+
+    def upsert(self, holding):
+        return bool(self.upsert_many([holding]))
+
+    def remove(self, ticker):
+        with self.lock, self._connection() as conn:
+            conn.execute("DELETE FROM holdings WHERE ticker = ?", (ticker,))
+            self._index.pop(ticker, None)
@@ -0,0 +1,188 @@
+import argparse
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Longest period first so the price store holds the full span before shorter slices are read.
+PREWARM_PERIODS = ['2y', '1y']
+
+CRON_FIELDS = [
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 7)
+]
+
+
+def _parse_field(text, low, high):
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(v) for v in part.split('-', 1))
+        else:
+            start = end = int(part)
+            if step != 1:
+                end = high
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Cron field '{text}' is out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    # Standard 5-field cron: minute hour day-of-month month day-of-week (0 or 7 = Sunday).
+    # Supports *, lists, ranges and steps; day-of-month and day-of-week are OR-ed like cron.
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Expected 5 cron fields, got '{expression}'")
+        self.expression = expression
+        self.minute, self.hour, self.day, self.month, weekday = (
+            _parse_field(part, low, high) for part, (name, low, high) in zip(parts, CRON_FIELDS)
+        )
+        self.weekday = {v % 7 for v in weekday}
+        self.any_day = parts[2] == '*'
+        self.any_weekday = parts[4] == '*'
+
+    def _day_matches(self, dt):
+        day_ok = dt.day in self.day
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekday
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def matches(self, dt):
+        return (dt.minute in self.minute and dt.hour in self.hour and dt.month in self.month
+                and self._day_matches(dt))
+
+    def next_after(self, dt):
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.month or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hour:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minute:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron schedule '{self.expression}' never fires")
+
+
+def warm_tickers(tickers, warm_one, executor=None):
+    # warm_one(ticker) fetches and pre-computes one ticker; its return value is kept as the
+    # ticker's warm snapshot. Returns a report with duration and coverage.
+    tickers = list(dict.fromkeys(tickers))
+    started = datetime.now()
+    start = time.perf_counter()
+    if executor is not None:
+        outcomes = executor.map(warm_one, tickers)
+    else:
+        outcomes = {}
+        for ticker in tickers:
+            try:
+                outcomes[ticker] = (warm_one(ticker), None)
+            except Exception as e:
+                outcomes[ticker] = (None, str(e))
+    snapshots = {t: result for t, (result, error) in outcomes.items() if error is None}
+    failed = {t: error for t, (result, error) in outcomes.items() if error is not None}
+    return {
+        'started': started,
+        'duration': time.perf_counter() - start,
+        'requested': len(tickers),
+        'warmed': len(snapshots),
+        'coverage': len(snapshots) / len(tickers) if tickers else 1.0,
+        'failed': failed,
+        'snapshots': snapshots
+    }
+
+
+class PrewarmScheduler:
+    def __init__(self, schedule, get_tickers, warm_one, executor=None, run_on_start=False):
+        self.schedule = CronSchedule(schedule) if isinstance(schedule, str) else schedule
+        self.get_tickers = get_tickers
+        self.warm_one = warm_one
+        self.executor = executor
+        self.run_on_start = run_on_start
+        self.last_report = None
+        self.next_run = None
+        self.running = False
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._loop, name='prewarm', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def run_now(self):
+        with self._lock:
+            self.running = True
+            try:
+                self.last_report = warm_tickers(self.get_tickers(), self.warm_one, self.executor)
+            finally:
+                self.running = False
+        return self.last_report
+
+    def _loop(self):
+        if self.run_on_start:
+            self.run_now()
+        while not self._stop.is_set():
+            self.next_run = self.schedule.next_after(datetime.now())
+            delay = (self.next_run - datetime.now()).total_seconds()
+            if self._stop.wait(max(0.0, delay)):
+                break
+            self.run_now()
+
+
+def main():
+    # Warms the on-disk price store and signal index from outside the app, e.g. before the server
+    # takes traffic or from the system cron. In-process UI caches only fill once the app runs.
+    from sterncurve.fetcher import FetchExecutor
+    from sterncurve.portfolio_store import PortfolioStore
+    from sterncurve.price_store import PriceStore
+    from sterncurve.providers import get_provider
+    from sterncurve.screener import get_prospective_stocks
+    from sterncurve.signal_index import SignalIndex
+
+    parser = argparse.ArgumentParser(description="Fill the price store for the curated sectors and saved portfolio")
+    parser.add_argument('tickers', nargs='*', help="symbols to warm instead of the curated sectors and portfolio")
+    parser.add_argument('--periods', nargs='+', default=PREWARM_PERIODS)
+    args = parser.parse_args()
+
+    tickers = args.tickers or ([t for sector in get_prospective_stocks().values() for t in sector]
+                               + sorted(PortfolioStore().tickers()))
+    executor = FetchExecutor()
+    store = PriceStore(provider=get_provider(executor=executor), on_write=SignalIndex().ingest)
+
+    def warm_one(ticker):
+        bars = {period: len(store.get_history(ticker, period)) for period in args.periods}
+        if not any(bars.values()):
+            raise ValueError("no price history")
+        return bars
+
+    try:
+        report = warm_tickers(tickers, warm_one, executor)
+    finally:
+        executor.shutdown()
+    for ticker, error in report['failed'].items():
+        print(f"failed: {ticker}: {error}", file=sys.stderr)
+    print(f"warmed {report['warmed']}/{report['requested']} tickers ({report['coverage']:.0%}) "
+          f"in {report['duration']:.1f}s", file=sys.stderr)
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
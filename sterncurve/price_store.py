@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from sterncurve._sqlite import SQLiteStore
+from sterncurve.providers import get_provider
+
+DATA_DIR = os.environ.get('STERNCURVE_DATA_DIR', os.path.join(os.path.expanduser('~'), '.sterncurve'))
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, 'prices.db')
+
+PERIOD_DAYS = {
+    '1mo': 31, '3mo': 92, '6mo': 183, '1y': 366, '2y': 731,
+    '5y': 1827, '10y': 3653, 'max': float('inf')
+}
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Relative tolerance when checking that a re-fetched overlap bar still matches the stored one.
+ADJUSTMENT_TOLERANCE = 1e-4
+
+
+class PriceStore(SQLiteStore):
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS prices ("
+        "ticker TEXT NOT NULL, date TEXT NOT NULL, "
+        "open REAL, high REAL, low REAL, close REAL, volume REAL, "
+        "PRIMARY KEY (ticker, date))",
+        "CREATE TABLE IF NOT EXISTS meta ("
+        "ticker TEXT PRIMARY KEY, span_days REAL NOT NULL, refreshed_at REAL NOT NULL)"
+    )
+
+    def __init__(self, path=DEFAULT_DB_PATH, provider=None, max_age=300, on_write=None):
+        self.fetch = (provider or get_provider()).history
+        self.max_age = max_age
+        # Called as on_write(ticker, bars, replace) with every batch of bars stored, so derived
+        # indexes (signal_index.SignalIndex.ingest) follow new bars without re-reading the table.
+        self.on_write = on_write
+        # self.lock only guards SQLite access; fetches run outside it under a per-ticker lock, so
+        # different tickers download concurrently while the same ticker is never fetched twice.
+        self.lock = threading.Lock()
+        self._ticker_locks = {}
+        super().__init__(path)
+
+    def _meta(self, conn, ticker):
+        return conn.execute("SELECT span_days, refreshed_at FROM meta WHERE ticker = ?", (ticker,)).fetchone()
+
+    def _ticker_lock(self, ticker):
+        with self.lock:
+            return self._ticker_locks.setdefault(ticker, threading.Lock())
+
+    def _tail(self, conn, ticker, count=2):
+        rows = conn.execute(
+            "SELECT date, open, high, low, close, volume FROM prices WHERE ticker = ? ORDER BY date DESC LIMIT ?",
+            (ticker, count)
+        ).fetchall()
+        frame = pd.DataFrame(rows[::-1], columns=['Date'] + PRICE_COLUMNS)
+        frame.index = pd.DatetimeIndex(pd.to_datetime(frame.pop('Date')), name='Date')
+        return frame
+
+    def _load(self, conn, ticker, since=None):
+        query = "SELECT date, open, high, low, close, volume FROM prices WHERE ticker = ?"
+        params = [ticker]
+        if since is not None:
+            query += " AND date >= ?"
+            params.append(since)
+        rows = conn.execute(query + " ORDER BY date", params).fetchall()
+        frame = pd.DataFrame(rows, columns=['Date'] + PRICE_COLUMNS)
+        frame.index = pd.DatetimeIndex(pd.to_datetime(frame.pop('Date')), name='Date')
+        return frame
+
+    def _write(self, conn, ticker, data, span_days, replace):
+        data = _normalize(data)
+        if replace:
+            conn.execute("DELETE FROM prices WHERE ticker = ?", (ticker,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO prices (ticker, date, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(ticker, idx.strftime('%Y-%m-%d'), *map(float, row)) for idx, row in zip(data.index, data[PRICE_COLUMNS].values)]
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (ticker, span_days, refreshed_at) VALUES (?, ?, ?)",
+            (ticker, span_days, time.time())
+        )
+        if self.on_write is not None:
+            self.on_write(ticker, data, replace)
+
+    def _has_corporate_action(self, data, after):
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        new_bars = index.normalize() > after
+        for column in ('Dividends', 'Stock Splits'):
+            if column in data.columns and (data[column].fillna(0).values[new_bars] != 0).any():
+                return True
+        return False
+
+    def _overlap_matches(self, stored, fetched, date):
+        if date not in stored.index or date not in fetched.index:
+            return False
+        old = stored.loc[date, 'Close']
+        new = fetched.loc[date, 'Close']
+        return abs(new - old) <= ADJUSTMENT_TOLERANCE * max(abs(old), 1.0)
+
+    def refresh(self, ticker, period):
+        span_days = PERIOD_DAYS[period]
+        with self._ticker_lock(ticker):
+            with self.lock, self._connection() as conn:
+                meta = self._meta(conn, ticker)
+                if meta is not None and meta[0] >= span_days and time.time() - meta[1] < self.max_age:
+                    return
+                # Only the last two bars are needed to anchor an incremental fetch.
+                stored = self._tail(conn, ticker) if meta else None
+
+            if meta is None or stored.empty or meta[0] < span_days:
+                data = self.fetch(ticker, period=period)
+                if data is not None and not data.empty:
+                    with self.lock, self._connection() as conn:
+                        self._write(conn, ticker, data, span_days, replace=True)
+                return
+
+            # Re-fetch from the second-to-last stored bar: it must still match (otherwise the
+            # adjusted history moved underneath us) and the last bar may have been partial.
+            anchor = stored.index[0]
+            data = self.fetch(ticker, start=anchor.strftime('%Y-%m-%d'))
+            if data is None or data.empty:
+                with self.lock, self._connection() as conn:
+                    conn.execute("UPDATE meta SET refreshed_at = ? WHERE ticker = ?", (time.time(), ticker))
+                return
+
+            fetched = _normalize(data)
+            if self._has_corporate_action(data, stored.index[-1]) or not self._overlap_matches(stored, fetched, anchor):
+                data = self.fetch(ticker, period=_period_for_span(meta[0]))
+                if data is not None and not data.empty:
+                    with self.lock, self._connection() as conn:
+                        self._write(conn, ticker, data, meta[0], replace=True)
+                return
+
+            with self.lock, self._connection() as conn:
+                self._write(conn, ticker, fetched[fetched.index >= anchor], meta[0], replace=False)
+
+    def get_history(self, ticker, period):
+        if period not in PERIOD_DAYS:
+            return self.fetch(ticker, period=period)
+        self.refresh(ticker, period)
+        with self.lock, self._connection() as conn:
+            since = None
+            last = conn.execute("SELECT MAX(date) FROM prices WHERE ticker = ?", (ticker,)).fetchone()[0]
+            if last is not None and PERIOD_DAYS[period] != float('inf'):
+                since = (pd.Timestamp(last) - timedelta(days=PERIOD_DAYS[period])).strftime('%Y-%m-%d')
+            return self._load(conn, ticker, since)
+
+    def invalidate(self, ticker):
+        with self.lock, self._connection() as conn:
+            conn.execute("DELETE FROM prices WHERE ticker = ?", (ticker,))
+            conn.execute("DELETE FROM meta WHERE ticker = ?", (ticker,))
+
+
+def _normalize(data):
+    data = data[PRICE_COLUMNS].dropna(subset=['Close'])
+    index = pd.DatetimeIndex(data.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    data = data.set_axis(index.normalize())
+    return data[~data.index.duplicated(keep='last')]
+
+
+def _period_for_span(span_days):
+    for period, days in PERIOD_DAYS.items():
+        if days >= span_days:
+            return period
+    return 'max'
@@ -0,0 +1,217 @@
+import argparse
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+PERIOD_OFFSETS = {
+    '1d': pd.DateOffset(days=1), '5d': pd.DateOffset(days=5),
+    '1mo': pd.DateOffset(months=1), '3mo': pd.DateOffset(months=3), '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1), '2y': pd.DateOffset(years=2), '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10)
+}
+
+
+def _strip_tz(data):
+    if isinstance(data.index, pd.DatetimeIndex) and data.index.tz is not None:
+        data = data.copy()
+        data.index = data.index.tz_localize(None)
+    return data
+
+
+class MarketDataProvider(ABC):
+    @abstractmethod
+    def history(self, ticker, period=None, start=None):
+        pass
+
+    @abstractmethod
+    def info(self, ticker):
+        pass
+
+    def bulk_history(self, tickers, period):
+        histories = {}
+        for ticker in tickers:
+            try:
+                data = self.history(ticker, period=period)
+            except Exception:
+                continue
+            if data is not None and not data.empty:
+                histories[ticker] = _strip_tz(data)
+        if not histories:
+            return pd.DataFrame()
+        return pd.concat(histories, axis=1, sort=True)
+
+
+class YFinanceProvider(MarketDataProvider):
+    def __init__(self, executor=None):
+        import yfinance as yf
+        self.yf = yf
+        self.executor = executor
+
+    def history(self, ticker, period=None, start=None):
+        if start is not None:
+            return self.yf.Ticker(ticker).history(start=start)
+        return self.yf.Ticker(ticker).history(period=period)
+
+    def info(self, ticker):
+        return self.yf.Ticker(ticker).info
+
+    def bulk_history(self, tickers, period):
+        tickers = list(tickers)
+        try:
+            bulk = self.yf.download(tickers, period=period, group_by='ticker', auto_adjust=True,
+                                    progress=False, threads=True)
+        except Exception:
+            bulk = None
+
+        histories = {}
+        missing = []
+        for ticker in tickers:
+            data = None
+            if bulk is not None and isinstance(bulk.columns, pd.MultiIndex) and ticker in bulk.columns.get_level_values(0):
+                data = bulk[ticker].dropna(how='all')
+            if data is None or data.empty:
+                missing.append(ticker)
+            else:
+                histories[ticker] = _strip_tz(data)
+
+        if missing:
+            fetch = lambda t: self.history(t, period=period)
+            if self.executor is not None:
+                fallback = self.executor.map(fetch, missing)
+            else:
+                fallback = {}
+                for ticker in missing:
+                    try:
+                        fallback[ticker] = (fetch(ticker), None)
+                    except Exception as e:
+                        fallback[ticker] = (None, str(e))
+            for ticker, (data, error) in fallback.items():
+                if error is None and data is not None and not data.empty:
+                    histories[ticker] = _strip_tz(data)
+
+        if not histories:
+            return pd.DataFrame()
+        return pd.concat(histories, axis=1, sort=True)
+
+
+class ReplayProvider(MarketDataProvider):
+    # Serves <TICKER>.csv (OHLCV) and <TICKER>.json (info) fixtures from a directory.
+    # Periods are measured back from the last recorded bar so replays are reproducible.
+    def __init__(self, directory, latency=0.0):
+        self.directory = directory
+        self.latency = latency
+        self._frames = {}
+
+    def _sleep(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _frame(self, ticker):
+        if ticker not in self._frames:
+            path = os.path.join(self.directory, f"{ticker}.csv")
+            if not os.path.exists(path):
+                self._frames[ticker] = pd.DataFrame()
+            else:
+                frame = pd.read_csv(path, index_col=0)
+                frame.index = pd.DatetimeIndex(pd.to_datetime(frame.index, utc=True).tz_localize(None), name='Date')
+                self._frames[ticker] = frame.sort_index()
+        return self._frames[ticker]
+
+    def _slice(self, frame, period=None, start=None):
+        if frame.empty:
+            return frame.copy()
+        if start is not None:
+            return frame[frame.index >= pd.Timestamp(start)].copy()
+        if period in PERIOD_OFFSETS:
+            return frame[frame.index > frame.index[-1] - PERIOD_OFFSETS[period]].copy()
+        return frame.copy()
+
+    def history(self, ticker, period=None, start=None):
+        self._sleep()
+        return self._slice(self._frame(ticker), period, start)
+
+    def info(self, ticker):
+        self._sleep()
+        path = os.path.join(self.directory, f"{ticker}.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def bulk_history(self, tickers, period):
+        self._sleep()
+        histories = {}
+        for ticker in tickers:
+            data = self._slice(self._frame(ticker), period)
+            if not data.empty:
+                histories[ticker] = data
+        if not histories:
+            return pd.DataFrame()
+        return pd.concat(histories, axis=1, sort=True)
+
+
+def get_provider(executor=None):
+    name = os.environ.get('STERNCURVE_PROVIDER', 'yfinance')
+    if name == 'replay':
+        return ReplayProvider(
+            os.environ.get('STERNCURVE_REPLAY_DIR', 'fixtures'),
+            latency=float(os.environ.get('STERNCURVE_REPLAY_LATENCY', 0))
+        )
+    if name == 'yfinance':
+        return YFinanceProvider(executor=executor)
+    raise ValueError(f"Unknown market data provider: {name}")
+
+
+def record_fixtures(tickers, directory, period='2y', provider=None):
+    provider = provider or YFinanceProvider()
+    os.makedirs(directory, exist_ok=True)
+    recorded = []
+    for ticker in tickers:
+        data = provider.history(ticker, period=period)
+        if data is None or data.empty:
+            continue
+        _strip_tz(data).to_csv(os.path.join(directory, f"{ticker}.csv"), index_label='Date')
+        with open(os.path.join(directory, f"{ticker}.json"), 'w') as f:
+            json.dump(provider.info(ticker), f, default=str)
+        recorded.append(ticker)
+    return recorded
+
+
+def synthesize_fixtures(tickers, directory, days=504, seed=0, end=None):
+    # Random-walk OHLCV for benchmarking when nothing has been recorded.
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    index = pd.bdate_range(end=end or pd.Timestamp.today().normalize(), periods=days, name='Date')
+    for ticker in tickers:
+        close = 50 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, days))) + rng.uniform(0, 200)
+        open_ = close * (1 + rng.normal(0, 0.005, days))
+        high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.015, days))
+        low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.015, days))
+        frame = pd.DataFrame({
+            'Open': open_, 'High': high, 'Low': low, 'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, days),
+            'Dividends': 0.0, 'Stock Splits': 0.0
+        }, index=index)
+        frame.to_csv(os.path.join(directory, f"{ticker}.csv"))
+        with open(os.path.join(directory, f"{ticker}.json"), 'w') as f:
+            json.dump({'longName': f"{ticker} (synthetic)", 'symbol': ticker, 'exchange': 'SIM'}, f)
+    return list(tickers)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Record or synthesize replay fixtures")
+    parser.add_argument('mode', choices=['record', 'synthesize'])
+    parser.add_argument('directory')
+    parser.add_argument('tickers', nargs='+')
+    parser.add_argument('--period', default='2y')
+    parser.add_argument('--days', type=int, default=504)
+    args = parser.parse_args()
+    if args.mode == 'record':
+        done = record_fixtures(args.tickers, args.directory, period=args.period)
+    else:
+        done = synthesize_fixtures(args.tickers, args.directory, days=args.days)
+    print(f"Wrote {len(done)} fixtures to {args.directory}")
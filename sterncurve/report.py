@@ -0,0 +1,83 @@
+from sterncurve.fundamentals import METRICS, analyze_fundamentals, get_sector_from_info
+from sterncurve.stochastic import OVERBOUGHT, OVERSOLD, calculate_stochastic, calculate_stochastic_score
+
+# The info fields a report reads, directly or through the sector classifier and fundamentals scorer.
+INFO_FIELDS = ('longName', 'exchange', 'sector', 'industry', 'forwardPE') + tuple(key for key, _ in METRICS.values())
+
+
+class AnalysisReport:
+    # Everything the Analysis page shows for one ticker, computed once from a price history and
+    # info dict. Rendering code only reads these attributes.
+    def __init__(self, ticker, data, info, k_period=14, d_period=3):
+        data = data.copy()
+        data['STOCH_K'], data['STOCH_D'] = calculate_stochastic(data['High'], data['Low'], data['Close'],
+                                                                k_period, d_period)
+        self.ticker = ticker
+        self.data = data
+        self.info = info
+        self.name = info.get('longName', ticker)
+        self.exchange = info.get('exchange', 'N/A')
+        self.price = data['Close'].iloc[-1]
+        self.change = ((data['Close'].iloc[-1] / data['Close'].iloc[0]) - 1) * 100
+
+        k = data['STOCH_K']
+        d = data['STOCH_D']
+        self.current_k = k.iloc[-1]
+        self.current_d = d.iloc[-1]
+        prev_k = k.iloc[-2]
+        prev_d = d.iloc[-2]
+        self.bullish_cross = (prev_k <= prev_d) and (self.current_k > self.current_d)
+        self.bearish_cross = (prev_k >= prev_d) and (self.current_k < self.current_d)
+        if self.bullish_cross:
+            self.signal_strength = 'Very Strong' if self.current_k < 30 else 'Strong' if self.current_k < 50 else 'Moderate'
+        elif self.bearish_cross:
+            self.signal_strength = 'Very Strong' if self.current_k > 70 else 'Strong' if self.current_k > 50 else 'Moderate'
+        else:
+            self.signal_strength = None
+
+        self.k_momentum = self.current_k - k.iloc[-5]
+        recent_k = k.iloc[-10:]
+        self.trend = "bullish" if recent_k.is_monotonic_increasing else "bearish" if recent_k.is_monotonic_decreasing else "mixed"
+        self.position = "Oversold" if self.current_k < OVERSOLD else "Overbought" if self.current_k > OVERBOUGHT else "Neutral"
+
+        self.stoch_score = calculate_stochastic_score(self.current_k, self.current_d, self.k_momentum, self.trend)
+        self.sector = get_sector_from_info(info)
+        self.fundamentals = analyze_fundamentals(info, self.sector)
+        self.combined_score = (self.stoch_score + self.fundamentals['rating']) / 2
+
+        self.risk_factors = []
+        self.risk_score = 0
+        if self.current_k > OVERBOUGHT:
+            self.risk_factors.append("Overbought Condition Increases Pullback Risk")
+            self.risk_score += 2
+        if self.current_k < OVERSOLD:
+            self.risk_factors.append("Oversold Condition Suggests Potential Reversal")
+            self.risk_score -= 1
+        if self.bearish_cross:
+            self.risk_factors.append("Recent Bearish Crossover Signals Downside")
+            self.risk_score += 2
+        if self.bullish_cross:
+            self.risk_factors.append("Recent Bullish Crossover Signals Upside")
+            self.risk_score -= 1
+
+        rating = self.fundamentals['rating']
+        self.technical_signal = 'Bullish' if self.stoch_score >= 60 else 'Bearish' if self.stoch_score < 45 else 'Neutral'
+        self.fundamental_health = 'Strong' if rating >= 60 else 'Weak' if rating < 45 else 'Fair'
+        self.combined_risk = 'Low' if self.combined_score >= 65 else 'High' if self.combined_score < 50 else 'Moderate'
+
+
+def data_version(data):
+    # Cheap fingerprint of a price history: changes when a bar is added, the last bar is revised
+    # or the history is re-adjusted.
+    if data is None or data.empty:
+        return None
+    last = data.iloc[-1]
+    return (len(data), str(data.index[-1]), float(data['Close'].iloc[0]), float(last['Close']), float(last['Volume']))
+
+
+def info_version(info):
+    # Fingerprint of the info fields the report uses: changes when refreshed fundamentals would
+    # change the sector, scores or header, whether or not a new price bar has arrived.
+    if not info:
+        return None
+    return tuple(repr(info.get(key)) for key in INFO_FIELDS)
@@ -0,0 +1,159 @@
+import argparse
+import importlib.util
+import os
+import sys
+
+from sterncurve.fetcher import FetchExecutor
+from sterncurve.fundamentals import classify_sectors, fundamentals_frame, score_fundamentals
+from sterncurve.providers import get_provider
+from sterncurve.screener import BUNDLED_UNIVERSES, DEFAULT_CHUNK_SIZE, get_prospective_stocks, load_universe, parse_symbol_csv, \
+    scan_universe
+
+FORMATS = ('csv', 'json', 'parquet')
+
+
+def resolve_universe(names=(), symbols_file=None, tickers=()):
+    # {symbol: name or None} from curated sectors, bundled universes, a symbol file and loose
+    # tickers, in that order without duplicates.
+    sectors = get_prospective_stocks()
+    universe = {}
+    for name in names:
+        if name in sectors:
+            members = dict.fromkeys(sectors[name])
+        elif name in BUNDLED_UNIVERSES:
+            members = load_universe(name)
+        else:
+            raise ValueError(f"Unknown sector or universe: {name}")
+        universe.update({t: n for t, n in members.items() if t not in universe})
+    if symbols_file:
+        with open(symbols_file, encoding='utf-8', errors='ignore') as f:
+            members = parse_symbol_csv(f.read())
+        universe.update({t: n for t, n in members.items() if t not in universe})
+    for ticker in tickers:
+        universe.setdefault(ticker.strip().upper(), None)
+    return universe
+
+
+def score_universe(universe, period, provider, executor=None, fundamentals=False, details=False,
+                   chunk_size=DEFAULT_CHUNK_SIZE, on_chunk=None):
+    # The Discover scan for a whole universe, optionally joined with fundamental ratings scored in
+    # one batch. Returns (results ranked best first, {ticker: reason} for tickers left out).
+    tickers = list(universe)
+    results, _, _ = scan_universe(tickers, period, provider.bulk_history, chunk_size=chunk_size,
+                                  on_chunk=on_chunk)
+    failed = {t: "no usable price history" for t in tickers if t not in set(results['ticker'])}
+    results['name'] = [universe.get(t) or t for t in results['ticker']]
+
+    if fundamentals and not results.empty:
+        scanned = list(results['ticker'])
+        if executor is not None:
+            outcomes = executor.map(provider.info, scanned)
+        else:
+            outcomes = {}
+            for ticker in scanned:
+                try:
+                    outcomes[ticker] = (provider.info(ticker), None)
+                except Exception as e:
+                    outcomes[ticker] = (None, str(e))
+        failed.update({t: f"info: {error}" for t, (info, error) in outcomes.items() if error is not None})
+        infos = {t: outcomes[t][0] or {} for t in scanned}
+        sectors = classify_sectors([info.get('sector') for info in infos.values()],
+                                   [info.get('industry') for info in infos.values()])
+        scores = score_fundamentals(fundamentals_frame(infos), sectors, details=details)
+        results['name'] = [universe.get(t) or infos[t].get('longName', t) for t in scanned]
+        results['sector'] = scores['sector'].to_numpy()
+        results['fundamental_rating'] = scores['rating'].to_numpy()
+        results['recommendation'] = scores['recommendation'].to_numpy()
+        results['combined_score'] = (results['score'] + results['fundamental_rating']) / 2
+        if details:
+            results['strengths'] = scores['strengths'].to_numpy()
+            results['weaknesses'] = scores['weaknesses'].to_numpy()
+
+    rank = 'combined_score' if 'combined_score' in results else 'score'
+    results = results.sort_values([rank, 'momentum'], ascending=False, kind='stable', ignore_index=True)
+    return results, failed
+
+
+def output_format(path, fmt=None):
+    # path '-' writes CSV or JSON to stdout; otherwise the format follows the extension.
+    return fmt or (os.path.splitext(path)[1].lstrip('.').lower() if path != '-' else 'csv')
+
+
+def parquet_available():
+    # pandas writes parquet through pyarrow or fastparquet, neither of which the app needs.
+    return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+
+def write_results(results, path, fmt=None):
+    fmt = output_format(path, fmt)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    if fmt == 'parquet':
+        if path == '-':
+            raise ValueError("Parquet output needs a file path")
+        results.to_parquet(path, index=False)
+    elif fmt == 'json':
+        text = results.to_json(orient='records', indent=2)
+        if path == '-':
+            sys.stdout.write(text + '\n')
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+    else:
+        results.to_csv(sys.stdout if path == '-' else path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan sectors or universes and score them without the UI. "
+                                                 "Exits 1 if any ticker could not be scored.")
+    parser.add_argument('universe', nargs='*', help="curated sector or bundled universe, e.g. 'Energy' or 'S&P 500'")
+    parser.add_argument('--symbols-file', help="CSV with a symbol/ticker column, or one symbol per line")
+    parser.add_argument('--tickers', nargs='+', default=[])
+    parser.add_argument('--period', default='1mo', help="price history scanned per ticker")
+    parser.add_argument('--fundamentals', action='store_true', help="also fetch info and score fundamentals")
+    parser.add_argument('--details', action='store_true', help="include fundamental strengths/weaknesses lists")
+    parser.add_argument('-o', '--output', default='-', help="output path (.csv, .json or .parquet); '-' for stdout")
+    parser.add_argument('--format', choices=FORMATS, help="override the format implied by --output")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--list', action='store_true', help="list the available sectors and universes")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    if args.list:
+        for name in list(get_prospective_stocks()) + list(BUNDLED_UNIVERSES):
+            print(name)
+        return 0
+    try:
+        universe = resolve_universe(args.universe, args.symbols_file, args.tickers)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if not universe:
+        parser.error("nothing to scan: name a sector or universe, --symbols-file or --tickers")
+    # Checked before scanning so a missing engine doesn't cost a full scan first.
+    if output_format(args.output, args.format) == 'parquet' and not parquet_available():
+        parser.error("parquet output needs pyarrow or fastparquet: pip install pyarrow")
+
+    def progress(done, total, frame, top, aggregates):
+        if not args.quiet:
+            print(f"scanned {done}/{total}", file=sys.stderr)
+
+    executor = FetchExecutor()
+    try:
+        results, failed = score_universe(universe, args.period, get_provider(executor=executor), executor,
+                                         args.fundamentals, args.details, args.chunk_size, progress)
+        write_results(results, args.output, args.format)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        executor.shutdown()
+
+    for ticker, reason in failed.items():
+        print(f"failed: {ticker}: {reason}", file=sys.stderr)
+    if not args.quiet:
+        print(f"scored {len(results)}/{len(universe)} tickers", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import csv
+import heapq
+import io
+import os
+
+import pandas as pd
+
+from sterncurve.stochastic import scan_stochastic
+
+UNIVERSE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'universes')
+
+BUNDLED_UNIVERSES = {
+    "S&P 500": 'sp500.csv',
+    "Nasdaq-100": 'nasdaq100.csv'
+}
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+def get_prospective_stocks():
+    return {
+        "Magnificent 7 (Tech)": ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA'],
+        "Finance": ['JPM', 'BAC', 'GS', 'WFC', 'V', 'MA', 'BRK-B'],
+        "Healthcare Industry": ['JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'ABT', 'MRK'],
+        "Consumer Staples": ['WMT', 'HD', 'NKE', 'SBUX', 'MCD', 'DIS', 'COST'],
+        "Energy": ['XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX'],
+        "Industrials": ['BA', 'CAT', 'GE', 'HON', 'UPS', 'MMM', 'DE']
+    }
+
+
+def parse_symbol_csv(text):
+    # Accepts a CSV with a symbol/ticker column (and optionally a name column), or a bare list of
+    # symbols one per line. Returns {symbol: name or None} in file order, without duplicates.
+    rows = list(csv.reader(io.StringIO(text)))
+    rows = [row for row in rows if row and any(cell.strip() for cell in row)]
+    if not rows:
+        return {}
+    header = [cell.strip().lower() for cell in rows[0]]
+    symbol_col = next((header.index(c) for c in ('symbol', 'ticker') if c in header), None)
+    name_col = next((header.index(c) for c in ('name', 'company', 'security') if c in header), None)
+    if symbol_col is None:
+        symbol_col = 0
+    else:
+        rows = rows[1:]
+
+    universe = {}
+    for row in rows:
+        if symbol_col >= len(row):
+            continue
+        symbol = row[symbol_col].strip().upper()
+        if not symbol or symbol in universe:
+            continue
+        name = row[name_col].strip() if name_col is not None and name_col < len(row) else None
+        universe[symbol] = name or None
+    return universe
+
+
+def load_universe(name):
+    with open(os.path.join(UNIVERSE_DIR, BUNDLED_UNIVERSES[name]), encoding='utf-8') as f:
+        return parse_symbol_csv(f.read())
+
+
+def chunked(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def ramped_chunks(items, first, size):
+    # Small first chunk so results show up after one quick fetch, doubling up to the full size.
+    items = list(items)
+    start = 0
+    step = max(1, min(first, size))
+    while start < len(items):
+        yield items[start:start + step]
+        start += step
+        step = min(step * 2, size)
+
+
+class ScanAggregates:
+    def __init__(self):
+        self.count = 0
+        self.oversold = 0
+        self.overbought = 0
+        self.bullish_crosses = 0
+        self.score_total = 0
+        self.momentum_total = 0.0
+
+    def update(self, frame):
+        if frame.empty:
+            return
+        self.count += len(frame)
+        self.oversold += int((frame['position'] == 'Oversold').sum())
+        self.overbought += int((frame['position'] == 'Overbought').sum())
+        self.bullish_crosses += int(frame['bullish_cross'].sum())
+        self.score_total += int(frame['score'].sum())
+        self.momentum_total += float(frame['momentum'].sum(skipna=False))
+
+    @property
+    def avg_score(self):
+        return self.score_total / self.count if self.count else 0
+
+    @property
+    def avg_momentum(self):
+        return self.momentum_total / self.count if self.count else 0
+
+
+def rank_key(row):
+    return (row['score'], row['momentum'])
+
+
+def scan_universe(tickers, period, bulk_history, chunk_size=DEFAULT_CHUNK_SIZE, first_chunk=10, top_k=3,
+                  on_chunk=None):
+    # Scans in chunks so only one chunk of raw prices is held at a time. Only the compact
+    # per-ticker signal rows are kept, and the top-k board is maintained with a bounded
+    # partial selection (heapq.nlargest keeps sorted(...)[:k] tie order).
+    tickers = list(tickers)
+    frames = []
+    top = []
+    aggregates = ScanAggregates()
+    scanned = 0
+    for chunk in ramped_chunks(tickers, first_chunk, chunk_size):
+        frame = scan_stochastic(bulk_history(chunk, period))
+        frames.append(frame)
+        top = heapq.nlargest(top_k, top + frame.to_dict('records'), key=rank_key)
+        aggregates.update(frame)
+        scanned += len(chunk)
+        if on_chunk:
+            on_chunk(scanned, len(tickers), frame, top, aggregates)
+    frames = [frame for frame in frames if not frame.empty]
+    results = pd.concat(frames, ignore_index=True) if frames else scan_stochastic(None)
+    return results, top, aggregates
@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from sterncurve._sqlite import SQLiteStore
+from sterncurve.backtest import price_matrices, signal_events
+from sterncurve.price_store import ADJUSTMENT_TOLERANCE, DATA_DIR
+from sterncurve.stochastic import StochasticState, stochastic_matrix
+
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, 'signals.db')
+
+EVENT_TYPES = ['bullish_cross', 'bearish_cross', 'oversold', 'oversold_exit', 'overbought', 'overbought_exit']
+
+EVENT_COLUMNS = ['ticker', 'date', 'event', 'k', 'd', 'close', 'sector']
+
+
+def _date(value):
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+class SignalIndex(SQLiteStore):
+    # Every %K/%D signal event per ticker, kept in SQLite with indexes on (event, date) and date,
+    # so universe-wide questions are answered without loading any prices. Each ticker also keeps
+    # its StochasticState, so newly landed bars are applied incrementally.
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS events ("
+        "ticker TEXT NOT NULL, date TEXT NOT NULL, event TEXT NOT NULL, k REAL, d REAL, close REAL, "
+        "PRIMARY KEY (ticker, date, event))",
+        "CREATE INDEX IF NOT EXISTS events_by_event ON events (event, date)",
+        "CREATE INDEX IF NOT EXISTS events_by_date ON events (date)",
+        # anchor_* is the second-to-last indexed bar: incoming data must still agree with it,
+        # otherwise the history was re-adjusted and the ticker is rebuilt.
+        "CREATE TABLE IF NOT EXISTS tickers ("
+        "ticker TEXT PRIMARY KEY, sector TEXT, last_date TEXT, anchor_date TEXT, anchor_close REAL, "
+        "state TEXT)",
+    )
+
+    def __init__(self, path=DEFAULT_DB_PATH, k_period=14, d_period=3):
+        self.k_period = k_period
+        self.d_period = d_period
+        self.lock = threading.RLock()
+        super().__init__(path)
+
+    def _ticker(self, conn, ticker):
+        return conn.execute("SELECT last_date, anchor_date, anchor_close, state FROM tickers WHERE ticker = ?",
+                            (ticker,)).fetchone()
+
+    def _save_state(self, conn, ticker, state, anchor_date, anchor_close):
+        conn.execute(
+            "INSERT INTO tickers (ticker, last_date, anchor_date, anchor_close, state) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(ticker) DO UPDATE SET last_date = excluded.last_date, anchor_date = excluded.anchor_date, "
+            "anchor_close = excluded.anchor_close, state = excluded.state",
+            (ticker, state.last_date, anchor_date, anchor_close, json.dumps(state.to_dict()))
+        )
+
+    def _insert(self, conn, ticker, dates, closes, k, d, start=0):
+        # dates/closes/k/d are one ticker's bars; events are recorded for bars from `start` on.
+        masks = signal_events(k[:, None], d[:, None])
+        rows = []
+        for event in EVENT_TYPES:
+            for i in np.flatnonzero(masks[event][start:, 0]) + start:
+                rows.append((ticker, dates[i], event, float(k[i]), float(d[i]), float(closes[i])))
+        conn.executemany("INSERT OR REPLACE INTO events (ticker, date, event, k, d, close) VALUES (?, ?, ?, ?, ?, ?)",
+                         rows)
+        return rows
+
+    def _rebuild(self, conn, ticker, dates, high, low, close):
+        k, d = stochastic_matrix(high, low, close, self.k_period, self.d_period)
+        # Events before this data's warm-up can't be recomputed from it, so they are kept;
+        # %K/%D are scale-free, so a re-adjusted history doesn't change them. A crossover needs the
+        # previous bar's %D too, so the first bar with a %D keeps its stored events as well.
+        defined = np.flatnonzero(~np.isnan(d))
+        if len(defined) > 1:
+            conn.execute("DELETE FROM events WHERE ticker = ? AND date >= ?", (ticker, dates[defined[1]]))
+        added = self._insert(conn, ticker, dates, close, k, d)
+        state = StochasticState.from_history(high, low, close, self.k_period, self.d_period, dates)
+        anchor = (dates[-2], float(close[-2])) if len(dates) >= 2 else (None, None)
+        self._save_state(conn, ticker, state, *anchor)
+        return added
+
+    def _ingest(self, conn, ticker, dates, high, low, close, replace=False):
+        # dates are 'YYYY-MM-DD' strings; high/low/close float arrays aligned with them.
+        known = ~(np.isnan(high) | np.isnan(low) | np.isnan(close))
+        if not known.all():
+            dates = [date for date, keep in zip(dates, known) if keep]
+            high, low, close = high[known], low[known], close[known]
+        if not dates:
+            return []
+        saved = None if replace else self._ticker(conn, ticker)
+        if saved is None or saved[3] is None:
+            return self._rebuild(conn, ticker, dates, high, low, close)
+        last_date, anchor_date, anchor_close, state = saved
+        if anchor_date is not None:
+            position = dates.index(anchor_date) if anchor_date in dates else None
+            if position is None and dates[0] <= anchor_date:
+                return self._rebuild(conn, ticker, dates, high, low, close)
+            if position is not None and abs(close[position] - anchor_close) > \
+                    ADJUSTMENT_TOLERANCE * max(abs(anchor_close), 1.0):
+                return self._rebuild(conn, ticker, dates, high, low, close)
+        if dates[0] > last_date:
+            # A gap between the index and this data can't be streamed across.
+            return self._rebuild(conn, ticker, dates, high, low, close)
+
+        fresh = [i for i, date in enumerate(dates) if date >= last_date]
+        if not fresh:
+            return []
+        state = StochasticState.from_dict(json.loads(state))
+        history = list(state.history)
+        if dates[fresh[0]] == last_date:
+            conn.execute("DELETE FROM events WHERE ticker = ? AND date = ?", (ticker, last_date))
+            history.pop()
+        previous = history[-1] if history else (np.nan, np.nan)
+        ks, ds = [previous[0]], [previous[1]]
+        for i in fresh:
+            k, d = state.update(high[i], low[i], close[i], dates[i])
+            ks.append(k)
+            ds.append(d)
+        # Row 0 is the bar before the first fresh one, there only to detect crossings into it.
+        added = self._insert(conn, ticker, [None] + [dates[i] for i in fresh], np.r_[np.nan, close[fresh]],
+                             np.array(ks), np.array(ds), start=1)
+        anchor = (dates[-2], float(close[-2])) if len(dates) >= 2 else (anchor_date, anchor_close)
+        self._save_state(conn, ticker, state, *anchor)
+        return added
+
+    def ingest(self, ticker, data, replace=False):
+        # data: one ticker's OHLC frame indexed by date. New bars after the last indexed one are
+        # streamed through the saved state; a revised last bar replaces its events. A first
+        # sighting, replace=True or a moved anchor bar rebuilds from data. Returns events added.
+        if data is None or data.empty:
+            return 0
+        high, low, close = (data[c].to_numpy(dtype=float) for c in ('High', 'Low', 'Close'))
+        dates = [_date(idx) for idx in data.index]
+        with self.lock, self._connection() as conn:
+            return len(self._ingest(conn, ticker, dates, high, low, close, replace))
+
+    def ingest_bulk(self, bulk):
+        # bulk: wide frame with (ticker, field) columns, as returned by bulk_history(). One
+        # transaction for the whole universe; a ticker's missing bars are dropped, not zero-filled.
+        if bulk is None or bulk.empty:
+            return 0
+        tickers, index, prices = price_matrices(bulk)
+        dates = [_date(idx) for idx in index]
+        with self.lock, self._connection() as conn:
+            return sum(len(self._ingest(conn, ticker, dates, prices['High'][:, i], prices['Low'][:, i],
+                                        prices['Close'][:, i])) for i, ticker in enumerate(tickers))
+
+    def ingest_changes(self, bulk):
+        # Like ingest_bulk, but returns the events that weren't recorded before: those on bars
+        # after each ticker's last indexed bar, or newly firing on a revised last bar. Events a
+        # rebuild re-adds are not new, and a ticker's first ingest only sets its baseline.
+        if bulk is None or bulk.empty:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+        tickers, index, prices = price_matrices(bulk)
+        dates = [_date(idx) for idx in index]
+        changes = []
+        with self.lock, self._connection() as conn:
+            for i, ticker in enumerate(tickers):
+                saved = self._ticker(conn, ticker)
+                last_date = saved[0] if saved else None
+                known = set(conn.execute("SELECT date, event FROM events WHERE ticker = ? AND date >= ?",
+                                         (ticker, last_date))) if last_date else set()
+                rows = self._ingest(conn, ticker, dates, prices['High'][:, i], prices['Low'][:, i],
+                                    prices['Close'][:, i])
+                if last_date:
+                    changes += [row for row in rows if row[1] >= last_date and row[1:3] not in known]
+            sectors = dict(conn.execute(
+                f"SELECT ticker, sector FROM tickers WHERE ticker IN ({', '.join('?' * len(tickers))})", tickers))
+        changes = pd.DataFrame(changes, columns=EVENT_COLUMNS[:-1])
+        changes['sector'] = changes['ticker'].map(sectors)
+        return changes.sort_values(['date', 'ticker'], ignore_index=True)
+
+    def set_sectors(self, sectors):
+        with self.lock, self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO tickers (ticker, sector) VALUES (?, ?) "
+                "ON CONFLICT(ticker) DO UPDATE SET sector = excluded.sector",
+                list(sectors.items())
+            )
+
+    def sectors(self):
+        with self.lock, self._connection() as conn:
+            return [row[0] for row in conn.execute(
+                "SELECT DISTINCT sector FROM tickers WHERE sector IS NOT NULL ORDER BY sector")]
+
+    def latest_date(self):
+        with self.lock, self._connection() as conn:
+            return conn.execute("SELECT MAX(last_date) FROM tickers").fetchone()[0]
+
+    def query(self, events=None, since=None, until=None, tickers=None, sectors=None, k_below=None, k_above=None,
+              limit=None):
+        # Newest first. events/tickers/sectors are lists (or one value); k_below/k_above filter on
+        # %K at the event bar, e.g. bullish crossovers in oversold territory: k_below=20.
+        clauses, params = [], []
+        for column, values in (('e.event', events), ('e.ticker', tickers), ('t.sector', sectors)):
+            if values is not None:
+                values = [values] if isinstance(values, str) else list(values)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params += values
+        for clause, value in (("e.date >= ?", since), ("e.date <= ?", until)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(_date(value))
+        for clause, value in (("e.k < ?", k_below), ("e.k > ?", k_above)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        sql = ("SELECT e.ticker, e.date, e.event, e.k, e.d, e.close, t.sector FROM events e "
+               "LEFT JOIN tickers t ON t.ticker = e.ticker")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.date DESC, e.ticker"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self.lock, self._connection() as conn:
+            return pd.DataFrame(conn.execute(sql, params).fetchall(), columns=EVENT_COLUMNS)
+
+    def remove(self, ticker):
+        with self.lock, self._connection() as conn:
+            conn.execute("DELETE FROM events WHERE ticker = ?", (ticker,))
+            conn.execute("DELETE FROM tickers WHERE ticker = ?", (ticker,))
@@ -0,0 +1,317 @@
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+OVERSOLD = 20
+OVERBOUGHT = 80
+
+
+def _running_extreme(values, window, ufunc):
+    # van Herk/Gil-Werman: split the series into window-sized blocks, take running extremes forward
+    # (prefix) and backward (suffix) inside each block, and every window is one suffix/prefix pair.
+    # O(1) work per bar regardless of window length; any NaN in a window yields NaN, like pandas.
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    out = np.full(values.shape, np.nan)
+    if window < 1 or n < window:
+        return out
+    if window == 1:
+        return values.copy()
+    blocks = -(-n // window)
+    padded = np.concatenate([values, np.full((blocks * window - n,) + values.shape[1:], np.nan)])
+    shaped = padded.reshape((blocks, window) + values.shape[1:])
+    prefix = ufunc.accumulate(shaped, axis=1).reshape(padded.shape)
+    suffix = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+    out[window - 1:] = ufunc(suffix[:n - window + 1], prefix[window - 1:n])
+    return out
+
+def rolling_mean(values, window):
+    # Adds the window's shifted slices oldest first, the order StochasticState sums in, and like
+    # pandas returns the value itself when the whole window is equal. A running prefix-sum
+    # difference drifts by ~1e-13, which turns %K == %D ties (K pinned at 100, 0 or a repeated
+    # reading) into false crossovers. NaN propagates, so windows containing a NaN stay NaN.
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if window < 1 or len(values) < window:
+        return out
+    count = len(values) - window + 1
+    first = values[:count]
+    total = first.copy()
+    same = np.ones(first.shape, dtype=bool)
+    for offset in range(1, window):
+        later = values[offset:offset + count]
+        total += later
+        same &= later == first
+    out[window - 1:] = np.where(same, first, total / window)
+    return out
+
+def rolling_min(values, window):
+    return _running_extreme(values, window, np.minimum)
+
+def rolling_max(values, window):
+    return _running_extreme(values, window, np.maximum)
+
+def _percent_k(close, lowest_low, highest_high):
+    # A flat window (highest == lowest) has no range to place the close in; report the midpoint
+    # instead of the inf/NaN the raw formula produces.
+    span = highest_high - lowest_low
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = (close - lowest_low) / span * 100
+    return np.where(span == 0, 50.0, k)
+
+def calculate_stochastic(high, low, close, k_period=14, d_period=3):
+    k = _percent_k(np.asarray(close, dtype=float),
+                   rolling_min(np.asarray(low, dtype=float), k_period),
+                   rolling_max(np.asarray(high, dtype=float), k_period))
+    d = rolling_mean(k, d_period)
+    return pd.Series(k, index=close.index), pd.Series(d, index=close.index)
+
+def calculate_stochastic_score(k, d, momentum, trend):
+    score = 50
+    if k < 20:
+        score += 20
+    elif k > 80:
+        score -= 20
+    if k > d:
+        score += 10
+    else:
+        score -= 10
+    if momentum > 10:
+        score += 15
+    elif momentum > 0:
+        score += 5
+    elif momentum > -10:
+        score -= 5
+    else:
+        score -= 15
+    if trend == "bullish":
+        score += 5
+    elif trend == "bearish":
+        score -= 5
+    return max(0, min(100, score))
+
+
+def stochastic_scores(k, d, momentum, trend):
+    score = np.full(len(k), 50)
+    score += np.select([k < 20, k > 80], [20, -20], 0)
+    score += np.where(k > d, 10, -10)
+    score += np.select([momentum > 10, momentum > 0, momentum > -10], [15, 5, -5], -15)
+    score += np.select([trend == "bullish", trend == "bearish"], [5, -5], 0)
+    return np.clip(score, 0, 100)
+
+
+def _bottom_align(values, valid):
+    # Pack each column's valid rows against the last row so row -1 is every ticker's latest bar,
+    # matching the per-ticker dropna() view the scalar code works on.
+    order = np.argsort(valid, axis=0, kind='stable')
+    return np.take_along_axis(values, order, axis=0)
+
+
+def stochastic_matrix(high, low, close, k_period=14, d_period=3):
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    k = _percent_k(close, rolling_min(low, k_period), rolling_max(high, k_period))
+    d = rolling_mean(k, d_period)
+    return k, d
+
+
+def scan_stochastic(bulk, k_period=14, d_period=3, min_bars=14):
+    # bulk: wide frame with (ticker, field) columns, as returned by bulk_history().
+    # Returns one row per ticker with a usable latest %K/%D, in the bulk frame's ticker order.
+    columns = ['ticker', 'name', 'price', 'change', 'stoch_k', 'stoch_d', 'momentum', 'trend',
+               'position', 'score', 'bullish_cross', 'bearish_cross']
+    if bulk is None or bulk.empty:
+        return pd.DataFrame(columns=columns)
+
+    tickers = list(dict.fromkeys(bulk.columns.get_level_values(0)))
+    high = bulk.xs('High', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+    low = bulk.xs('Low', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+    close = bulk.xs('Close', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+
+    valid = ~np.isnan(close)
+    bars = valid.sum(axis=0)
+    high, low, close = (_bottom_align(m, valid) for m in (high, low, close))
+
+    k, d = stochastic_matrix(high, low, close, k_period, d_period)
+    n = len(close)
+    if n < 2:
+        return pd.DataFrame(columns=columns)
+
+    current_k, current_d = k[-1], d[-1]
+    prev_k, prev_d = k[-2], d[-2]
+    momentum = current_k - k[-5] if n >= 5 else np.zeros(len(tickers))
+
+    recent = k[-10:]
+    steps = np.diff(recent, axis=0)
+    rising = np.all(steps >= 0, axis=0)
+    falling = np.all(steps <= 0, axis=0)
+    trend = np.where(rising, "bullish", np.where(falling, "bearish", "mixed"))
+
+    first_close = close[n - np.maximum(bars, 1), np.arange(len(tickers))]
+    price = close[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (price / first_close - 1) * 100
+
+    position = np.where(current_k < OVERSOLD, "Oversold", np.where(current_k > OVERBOUGHT, "Overbought", "Neutral"))
+    crossable = ~(np.isnan(prev_k) | np.isnan(prev_d))
+    bullish_cross = crossable & (prev_k <= prev_d) & (current_k > current_d)
+    bearish_cross = crossable & (prev_k >= prev_d) & (current_k < current_d)
+
+    results = pd.DataFrame({
+        'ticker': tickers,
+        'name': tickers,
+        'price': price,
+        'change': change,
+        'stoch_k': current_k,
+        'stoch_d': current_d,
+        'momentum': momentum,
+        'trend': trend,
+        'position': position,
+        'score': stochastic_scores(current_k, current_d, momentum, trend),
+        'bullish_cross': bullish_cross,
+        'bearish_cross': bearish_cross
+    })
+    keep = (bars >= min_bars) & ~np.isnan(current_k) & ~np.isnan(current_d)
+    return results[keep].reset_index(drop=True)
+
+
+class StochasticState:
+    # Streaming %K/%D for one (ticker, k_period, d_period). Monotonic deques keep the window's
+    # highest high and lowest low, so each new bar costs amortized O(1). Enough K/D history is
+    # kept to report momentum, trend and crossovers the same way scan_stochastic does.
+    HISTORY = 10
+
+    def __init__(self, k_period=14, d_period=3):
+        self.k_period = k_period
+        self.d_period = d_period
+        self.bars = 0
+        self.last_date = None
+        self.window = deque(maxlen=k_period)
+        self.k_window = deque(maxlen=d_period)
+        self.history = deque(maxlen=max(self.HISTORY, d_period, 2))
+        self._highs = deque()
+        self._lows = deque()
+        self.close = math.nan
+
+    @classmethod
+    def from_history(cls, high, low, close, k_period=14, d_period=3, dates=None):
+        state = cls(k_period, d_period)
+        high, low, close = (np.asarray(v, dtype=float) for v in (high, low, close))
+        warmup = k_period + d_period + cls.HISTORY
+        start = max(0, len(close) - warmup)
+        state.bars = start
+        dates = list(dates) if dates is not None else [None] * len(close)
+        for i in range(start, len(close)):
+            state.update(high[i], low[i], close[i], dates[i])
+        return state
+
+    def _push_extremes(self, index, high, low):
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((index, high))
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((index, low))
+        oldest = index - self.k_period + 1
+        while self._highs[0][0] < oldest:
+            self._highs.popleft()
+        while self._lows[0][0] < oldest:
+            self._lows.popleft()
+
+    def _rebuild_extremes(self):
+        self._highs.clear()
+        self._lows.clear()
+        first = self.bars - len(self.window)
+        for offset, (high, low) in enumerate(self.window):
+            self._push_extremes(first + offset, high, low)
+
+    @property
+    def k(self):
+        return self.history[-1][0] if self.history else math.nan
+
+    @property
+    def d(self):
+        return self.history[-1][1] if self.history else math.nan
+
+    def update(self, high, low, close, date=None):
+        # A bar with the same date as the last one revises it (e.g. an intraday refresh).
+        if date is not None and str(date) == self.last_date and self.window:
+            self.window.pop()
+            self.bars -= 1
+            self._rebuild_extremes()
+            self.history.pop()
+            self.k_window.clear()
+            self.k_window.extend(k for k, _ in list(self.history)[-(self.d_period - 1):] if self.d_period > 1)
+
+        date = None if date is None else str(date)
+        index = self.bars
+        self.window.append((float(high), float(low)))
+        self._push_extremes(index, float(high), float(low))
+        self.bars += 1
+        self.last_date = date
+        self.close = float(close)
+
+        k = math.nan
+        if self.bars >= self.k_period:
+            highest = self._highs[0][1]
+            lowest = self._lows[0][1]
+            k = 50.0 if highest == lowest else (self.close - lowest) / (highest - lowest) * 100
+        self.k_window.append(k)
+        d = math.nan
+        if len(self.k_window) == self.d_period and not any(math.isnan(v) for v in self.k_window):
+            # Same operations as rolling_mean, so streamed and vectorized %D agree bit for bit.
+            d = self.k_window[0] if len(set(self.k_window)) == 1 else sum(self.k_window) / self.d_period
+        self.history.append((k, d))
+        return k, d
+
+    def signals(self):
+        k, d = self.k, self.d
+        ks = [pair[0] for pair in self.history]
+        momentum = k - ks[-5] if len(ks) >= 5 else 0
+        steps = np.diff(ks)
+        trend = "bullish" if np.all(steps >= 0) else "bearish" if np.all(steps <= 0) else "mixed"
+        bullish_cross = bearish_cross = False
+        if len(self.history) >= 2:
+            prev_k, prev_d = self.history[-2]
+            if not (math.isnan(prev_k) or math.isnan(prev_d)):
+                bullish_cross = prev_k <= prev_d and k > d
+                bearish_cross = prev_k >= prev_d and k < d
+        return {
+            'stoch_k': k,
+            'stoch_d': d,
+            'momentum': momentum,
+            'trend': trend,
+            'position': "Oversold" if k < OVERSOLD else "Overbought" if k > OVERBOUGHT else "Neutral",
+            'score': calculate_stochastic_score(k, d, momentum, trend),
+            'bullish_cross': bullish_cross,
+            'bearish_cross': bearish_cross
+        }
+
+    def to_dict(self):
+        nan_to_none = lambda v: None if isinstance(v, float) and math.isnan(v) else v
+        return {
+            'k_period': self.k_period,
+            'd_period': self.d_period,
+            'bars': self.bars,
+            'last_date': None if self.last_date is None else str(self.last_date),
+            'close': nan_to_none(self.close),
+            'window': [list(bar) for bar in self.window],
+            'k_window': [nan_to_none(v) for v in self.k_window],
+            'history': [[nan_to_none(k), nan_to_none(d)] for k, d in self.history]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        none_to_nan = lambda v: math.nan if v is None else v
+        state = cls(data['k_period'], data['d_period'])
+        state.bars = data['bars']
+        state.last_date = data['last_date']
+        state.close = none_to_nan(data['close'])
+        state.window.extend(tuple(bar) for bar in data['window'])
+        state.k_window.extend(none_to_nan(v) for v in data['k_window'])
+        state.history.extend((none_to_nan(k), none_to_nan(d)) for k, d in data['history'])
+        state._rebuild_extremes()
+        return state
@@ -0,0 +1,137 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from sterncurve.backtest import DEFAULT_HOLD, SIGNALS, price_matrices, signal_events, simulate_trades
+from sterncurve.stochastic import stochastic_matrix
+
+FIELDS = ('Open', 'High', 'Low', 'Close')
+DEFAULT_WORKERS = int(os.environ.get('STERNCURVE_SWEEP_WORKERS', os.cpu_count() or 1))
+
+DEFAULT_GRID = {
+    'k_period': [5, 9, 14, 21],
+    'd_period': [3, 5],
+    'oversold': [10, 15, 20, 25, 30],
+    'overbought': [70, 75, 80, 85, 90]
+}
+
+# Signals whose events move with the oversold/overbought levels; crossovers depend on %K/%D only.
+ZONE_SIGNALS = ('oversold', 'overbought')
+
+_prices = None
+_segment = None
+
+
+def _attach(name, shape):
+    # Worker initializer: map the parent's price block instead of unpickling a copy per task.
+    global _prices, _segment
+    _segment = shared_memory.SharedMemory(name=name)
+    block = np.ndarray(shape, dtype=float, buffer=_segment.buf)
+    _prices = dict(zip(FIELDS, block))
+
+
+def _totals(trades, horizon):
+    # Sums that combine across signals without keeping the per-trade arrays around.
+    forward = trades['forward'][horizon]
+    known = ~np.isnan(forward)
+    return np.array([len(trades['return']), (trades['return'] > 0).sum(), trades['return'].sum(),
+                     forward[known].sum(), known.sum(), trades['drawdown'].sum()], dtype=float)
+
+
+def _stats(totals, horizon):
+    count, hits, returns, forward, known, drawdown = totals
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'trades': int(count),
+            'hit_rate': hits / count,
+            'avg_return': returns / count,
+            f'avg_fwd_{horizon}': forward / known,
+            'avg_drawdown': drawdown / count
+        }
+
+
+def evaluate(prices, k_period, d_period, parts, hold=DEFAULT_HOLD, stop_loss=None, take_profit=None,
+             horizon=DEFAULT_HOLD):
+    # parts: (signal, level) pairs to simulate for one %K/%D setting. The oversold and overbought
+    # events depend only on their own level and crossovers on neither (level None), so a grid of
+    # threshold pairs needs each part once. Returns {(signal, level): totals}.
+    k, d = stochastic_matrix(prices['High'], prices['Low'], prices['Close'], k_period, d_period)
+    totals = {}
+    for name, level in parts:
+        if name == 'oversold':
+            events = signal_events(k, d, oversold=level)
+        elif name == 'overbought':
+            events = signal_events(k, d, overbought=level)
+        else:
+            events = signal_events(k, d)
+        rows, cols = np.nonzero(events[name])
+        trades = simulate_trades(rows, cols, SIGNALS[name], prices, hold, stop_loss, take_profit, (horizon,))
+        totals[name, level] = _totals(trades, horizon)
+    return k_period, d_period, totals
+
+
+def _evaluate_shared(task, options):
+    return evaluate(_prices, *task, **options)
+
+
+def sweep_tasks(grid, signals, splits=1):
+    # One task per (k_period, d_period) and slice of its parts, so %K/%D is computed once per
+    # task and there are enough tasks to keep every worker busy.
+    parts = [(name, level) for name in signals
+             for level in (grid[name] if name in ZONE_SIGNALS else [None])]
+    splits = max(1, min(splits, len(parts)))
+    return [(k, d, parts[i::splits]) for k, d in itertools.product(grid['k_period'], grid['d_period'])
+            for i in range(splits)]
+
+
+def sweep(bulk, grid=None, signals=tuple(SIGNALS), hold=DEFAULT_HOLD, stop_loss=None, take_profit=None,
+          horizon=DEFAULT_HOLD, min_trades=30, workers=DEFAULT_WORKERS):
+    # Backtests every setting in the grid across the universe in `bulk` and returns them ranked by
+    # mean signed forward return at `horizon` bars. Settings with fewer than min_trades trades are
+    # left out so a handful of lucky events can't top the table.
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    columns = ['k_period', 'd_period', 'oversold', 'overbought', 'trades', 'hit_rate', 'avg_return',
+               f'avg_fwd_{horizon}', 'avg_drawdown']
+    if bulk is None or bulk.empty:
+        return pd.DataFrame(columns=columns)
+    settings = len(grid['k_period']) * len(grid['d_period'])
+    tasks = sweep_tasks(grid, signals, -(-2 * workers // settings) if workers > 1 else 1)
+    options = {'hold': hold, 'stop_loss': stop_loss, 'take_profit': take_profit, 'horizon': horizon}
+    _, _, prices = price_matrices(bulk)
+    if workers <= 1:
+        results = [evaluate(prices, *task, **options) for task in tasks]
+    else:
+        block = np.stack([prices[field] for field in FIELDS])
+        segment = shared_memory.SharedMemory(create=True, size=block.nbytes)
+        try:
+            np.ndarray(block.shape, dtype=float, buffer=segment.buf)[:] = block
+            del block
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                     initargs=(segment.name, (len(FIELDS),) + prices['Close'].shape)) as pool:
+                results = list(pool.map(_evaluate_shared, tasks, itertools.repeat(options)))
+        finally:
+            segment.close()
+            segment.unlink()
+
+    totals = {}
+    for k_period, d_period, parts in results:
+        for (name, level), part in parts.items():
+            totals[k_period, d_period, name, level] = part
+    rows = []
+    for k_period, d_period in itertools.product(grid['k_period'], grid['d_period']):
+        for oversold, overbought in itertools.product(grid['oversold'], grid['overbought']):
+            if oversold >= overbought:
+                continue
+            levels = {'oversold': oversold, 'overbought': overbought}
+            combined = sum((totals[k_period, d_period, name, levels.get(name)] for name in signals), np.zeros(6))
+            rows.append({'k_period': k_period, 'd_period': d_period, 'oversold': oversold,
+                         'overbought': overbought, **_stats(combined, horizon)})
+
+    ranked = pd.DataFrame(rows, columns=columns)
+    ranked = ranked[ranked['trades'] >= min_trades]
+    return ranked.sort_values([f'avg_fwd_{horizon}', 'hit_rate'], ascending=False, kind='stable',
+                              ignore_index=True)
@@ -0,0 +1,183 @@
+import csv
+import heapq
+import os
+import re
+from bisect import bisect_left, bisect_right
+
+SYMBOL_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'symbols', 'listings.csv')
+
+# Common names that are not the first word of the listed company name.
+ALIASES = {
+    'apple': 'AAPL', 'microsoft': 'MSFT', 'google': 'GOOGL', 'amazon': 'AMZN',
+    'tesla': 'TSLA', 'meta': 'META', 'nvidia': 'NVDA'
+}
+
+# Symbols with an exchange suffix, index or FX/futures notation are outside the bundled US
+# listings and are passed through to the provider unchecked.
+PASSTHROUGH_PATTERN = re.compile(r'^[\^]|[.=]')
+
+
+def _tokens(name):
+    return re.findall(r'[a-z0-9]+', name.lower())
+
+
+class SortedKeys:
+    # (key, rank) pairs held as one key list sorted with a parallel rank list. Lookups are
+    # bisections, and the whole index is a few containers for the garbage collector to walk
+    # instead of a dict or list per key. Inserts are buffered and merged in by settle().
+    def __init__(self):
+        self.keys = []
+        self.ranks = []
+        self._pending = []
+
+    def insert(self, key, rank):
+        self._pending.append(key)
+        self._pending.append(rank)
+
+    def settle(self):
+        if not self._pending:
+            return
+        keys = self.keys + self._pending[::2]
+        ranks = self.ranks + self._pending[1::2]
+        # Stable on the key alone, so each key's ranks stay in insertion (ascending) order.
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.ranks = [ranks[i] for i in order]
+        self._pending = []
+
+    def _span(self, key):
+        self.settle()
+        return bisect_left(self.keys, key), bisect_right(self.keys, key)
+
+    def exact(self, key):
+        lo, hi = self._span(key)
+        return self.ranks[lo:hi]
+
+
+class PrefixIndex(SortedKeys):
+    # Keys inserted in ascending rank order; a prefix lookup returns the first `limit` ranks of
+    # keys starting with it.
+    def __init__(self, limit=8):
+        super().__init__()
+        self.limit = limit
+
+    def prefix(self, key):
+        self.settle()
+        lo = bisect_left(self.keys, key)
+        hi = bisect_left(self.keys, key[:-1] + chr(ord(key[-1]) + 1)) if key else len(self.keys)
+        return heapq.nsmallest(self.limit, set(self.ranks[lo:hi]))
+
+
+class DeletionIndex(SortedKeys):
+    # Symmetric-delete fuzzy matching: every key is also stored under each single-character
+    # deletion, and a query hits the same entries with its own deletions. That finds keys one
+    # substitution, insertion, deletion or adjacent swap away with a handful of bisections.
+    def __init__(self, min_length=1):
+        super().__init__()
+        self.min_length = min_length
+
+    def _variants(self, key):
+        return {key} | {key[:i] + key[i + 1:] for i in range(len(key))}
+
+    def insert(self, key, rank):
+        if len(key) < self.min_length:
+            return
+        for variant in self._variants(key):
+            super().insert(variant, rank)
+
+    def lookup(self, key):
+        if len(key) < self.min_length:
+            return []
+        return sorted({rank for variant in self._variants(key) for rank in self.exact(variant)})
+
+
+class SymbolIndex:
+    def __init__(self, path=SYMBOL_INDEX_PATH, limit=8):
+        self.limit = limit
+        self.symbols = []
+        self.names = []
+        self.exchanges = []
+        self.ranks = {}
+        self.symbol_prefixes = PrefixIndex(limit)
+        self.name_prefixes = PrefixIndex(limit)
+        self.symbol_typos = DeletionIndex()
+        self.name_typos = DeletionIndex(min_length=4)
+        with open(path, encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                self.add(row['symbol'], row['name'], row.get('exchange', ''))
+        # Sort once up front rather than on the first lookup, which may come from several sessions.
+        for index in (self.symbol_prefixes, self.name_prefixes, self.symbol_typos, self.name_typos):
+            index.settle()
+
+    def add(self, symbol, name, exchange=''):
+        symbol = symbol.strip().upper()
+        if not symbol or symbol in self.ranks:
+            return
+        rank = len(self.symbols)
+        self.symbols.append(symbol)
+        self.names.append(name)
+        self.exchanges.append(exchange)
+        self.ranks[symbol] = rank
+        self.symbol_prefixes.insert(symbol, rank)
+        self.symbol_typos.insert(symbol, rank)
+        for token in dict.fromkeys(_tokens(name)):
+            self.name_prefixes.insert(token, rank)
+            self.name_typos.insert(token, rank)
+
+    def __contains__(self, symbol):
+        return symbol in self.ranks
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def name(self, symbol):
+        rank = self.ranks.get(symbol)
+        return self.names[rank] if rank is not None else None
+
+    def resolve(self, query):
+        # Maps user input to a listed symbol, or None when it is not a known listing.
+        text = query.strip()
+        symbol = text.upper()
+        for candidate in (symbol, symbol.replace('.', '-'), symbol.replace('/', '-')):
+            if candidate in self.ranks:
+                return candidate
+        if PASSTHROUGH_PATTERN.search(symbol):
+            return symbol
+        if text.lower() in ALIASES:
+            return ALIASES[text.lower()]
+        tokens = _tokens(text)
+        if len(tokens) == 1:
+            # A single word that starts a listed company's name ("netflix").
+            starts = [rank for rank in self.name_prefixes.exact(tokens[0]) if _tokens(self.names[rank])[:1] == tokens]
+            if starts:
+                return self.symbols[min(starts)]
+        return None
+
+    def _name_matches(self, tokens):
+        # Every token but the last must be a whole word of the name; the last may be a prefix.
+        if len(tokens) == 1:
+            return self.name_prefixes.prefix(tokens[0])
+        candidates = None
+        for token in tokens[:-1]:
+            ranks = set(self.name_prefixes.exact(token))
+            candidates = ranks if candidates is None else candidates & ranks
+        last = tokens[-1]
+        return sorted(rank for rank in candidates
+                      if any(word.startswith(last) for word in _tokens(self.names[rank])))[:self.limit]
+
+    def search(self, query, limit=None):
+        # Ranked suggestions: symbol prefixes, then name-word prefixes, then near misses about one
+        # typo away from a symbol or a name word. Returns (symbol, name) pairs.
+        limit = limit or self.limit
+        text = query.strip()
+        if not text:
+            return []
+        ranks = list(self.symbol_prefixes.prefix(text.upper().replace('.', '-')))
+        tokens = _tokens(text)
+        if tokens:
+            ranks += self._name_matches(tokens)
+        if len(dict.fromkeys(ranks)) < limit:
+            ranks += self.symbol_typos.lookup(text.upper())
+            if tokens:
+                ranks += self.name_typos.lookup(tokens[-1])
+        return [(self.symbols[rank], self.names[rank]) for rank in list(dict.fromkeys(ranks))[:limit]]
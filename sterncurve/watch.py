@@ -0,0 +1,225 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sterncurve.fetcher import FetchExecutor
+from sterncurve.portfolio_store import PortfolioStore
+from sterncurve.prewarm import CronSchedule
+from sterncurve.providers import get_provider
+from sterncurve.signal_index import EVENT_TYPES, SignalIndex
+
+DEFAULT_SCHEDULE = os.environ.get('STERNCURVE_WATCH_SCHEDULE', '*/15 * * * 1-5')
+DEFAULT_CONCURRENCY = int(os.environ.get('STERNCURVE_WATCH_CONCURRENCY', 8))
+DEFAULT_CHUNK_SIZE = 100
+# Enough daily bars to seed %K/%D for a ticker seen for the first time or after a long gap.
+WATCH_PERIOD = '1mo'
+# The rules the Analyzer reports on: zone entries and %K/%D crossovers.
+ALERT_EVENTS = ['oversold', 'overbought', 'bullish_cross', 'bearish_cross']
+
+EVENT_MESSAGES = {
+    'oversold': "entered oversold territory",
+    'overbought': "entered overbought territory",
+    'oversold_exit': "left oversold territory",
+    'overbought_exit': "left overbought territory",
+    'bullish_cross': "bullish %K/%D crossover",
+    'bearish_cross': "bearish %K/%D crossover"
+}
+
+
+def _log(message):
+    print(f"{datetime.now():%Y-%m-%d %H:%M:%S} {message}", file=sys.stderr, flush=True)
+
+
+def _log_report(report):
+    _log(f"cycle: {report['updated']}/{report['requested']} tickers updated, {report['alerts']} alerts, "
+         f"{len(report['failed'])} failed in {report['duration']:.1f}s")
+
+
+class StreamSink:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send(self, alerts):
+        for alert in alerts:
+            print(f"{alert['date']} {alert['ticker']:<6} {alert['message']} "
+                  f"(%K {alert['k']:.1f}, %D {alert['d']:.1f}, close {alert['close']:.2f})", file=self.stream)
+        self.stream.flush()
+
+
+class FileSink:
+    # One JSON object per line, appended.
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def send(self, alerts):
+        with open(self.path, 'a') as f:
+            for alert in alerts:
+                f.write(json.dumps(alert) + '\n')
+
+
+class WebhookSink:
+    # POSTs {"alerts": [...]} as JSON; any local HTTP endpoint can stand in for a chat webhook.
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alerts):
+        request = urllib.request.Request(self.url, data=json.dumps({'alerts': alerts}).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'}, method='POST')
+        urllib.request.urlopen(request, timeout=self.timeout).close()
+
+
+def make_sink(spec):
+    # 'stdout', 'file:<path>' or an http(s) URL.
+    if spec == 'stdout':
+        return StreamSink()
+    if spec.startswith('file:'):
+        return FileSink(spec[len('file:'):])
+    if spec.startswith(('http://', 'https://')):
+        return WebhookSink(spec)
+    raise ValueError(f"Unknown alert sink: {spec}")
+
+
+class SignalWatcher:
+    # Each cycle fetches the latest bars for every watched ticker in chunks, at most `concurrency`
+    # chunks in flight, streams them into the signal index and sends the events that fired on new
+    # bars to every sink. Fetching and SQLite run on a thread pool; the event loop only schedules.
+    def __init__(self, get_tickers, provider, index, sinks, events=ALERT_EVENTS, period=WATCH_PERIOD,
+                 concurrency=DEFAULT_CONCURRENCY, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.get_tickers = get_tickers
+        self.provider = provider
+        self.index = index
+        self.sinks = sinks
+        self.events = list(events)
+        self.period = period
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.last_report = None
+        self._stop = asyncio.Event()
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='watch')
+
+    def stop(self):
+        self._stop.set()
+
+    async def _update(self, semaphore, chunk):
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            bulk = await loop.run_in_executor(self._pool, self.provider.bulk_history, chunk, self.period)
+            changes = await loop.run_in_executor(self._pool, self.index.ingest_changes, bulk)
+        fetched = set(bulk.columns.get_level_values(0)) if not bulk.empty else set()
+        return fetched, changes
+
+    async def cycle(self):
+        loop = asyncio.get_running_loop()
+        started = datetime.now()
+        start = time.perf_counter()
+        tickers = list(dict.fromkeys(await loop.run_in_executor(self._pool, self.get_tickers)))
+        chunks = [tickers[i:i + self.chunk_size] for i in range(0, len(tickers), self.chunk_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(*(self._update(semaphore, chunk) for chunk in chunks),
+                                        return_exceptions=True)
+
+        updated = set()
+        failed = {}
+        alerts = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                failed.update(dict.fromkeys(chunk, str(outcome)))
+                continue
+            fetched, changes = outcome
+            updated |= fetched
+            failed.update({t: "no data" for t in chunk if t not in fetched})
+            changes = changes[changes['event'].isin(self.events)]
+            for row in changes.to_dict('records'):
+                row['sector'] = row['sector'] if isinstance(row['sector'], str) else None
+                row['message'] = f"{row['ticker']} {EVENT_MESSAGES[row['event']]}"
+                alerts.append(row)
+        alerts.sort(key=lambda alert: (alert['date'], alert['ticker'], alert['event']))
+
+        for sink in self.sinks:
+            if not alerts:
+                break
+            try:
+                await loop.run_in_executor(self._pool, sink.send, alerts)
+            except Exception as e:
+                _log(f"{type(sink).__name__} failed: {e}")
+
+        self.last_report = {
+            'started': started,
+            'duration': time.perf_counter() - start,
+            'requested': len(tickers),
+            'updated': len(updated),
+            'alerts': len(alerts),
+            'failed': failed
+        }
+        return self.last_report
+
+    async def run(self, schedule, run_on_start=True):
+        schedule = CronSchedule(schedule) if isinstance(schedule, str) else schedule
+        run = run_on_start
+        while not self._stop.is_set():
+            if run:
+                _log_report(await self.cycle())
+            run = True
+            next_run = schedule.next_after(datetime.now())
+            try:
+                await asyncio.wait_for(self._stop.wait(), max(0.0, (next_run - datetime.now()).total_seconds()))
+            except asyncio.TimeoutError:
+                pass
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def watched_tickers(extra=()):
+    # The portfolio is re-read every cycle so holdings added in the app are picked up.
+    return sorted(PortfolioStore().tickers()) + list(extra)
+
+
+async def _main(args):
+    extra = list(args.tickers)
+    if args.universe:
+        from sterncurve.screener import load_universe
+        for name in args.universe:
+            extra += list(load_universe(name))
+    index = SignalIndex(args.db) if args.db else SignalIndex()
+    sinks = [make_sink(spec) for spec in args.sink or ['stdout']]
+    watcher = SignalWatcher(lambda: watched_tickers(extra), get_provider(executor=FetchExecutor()), index, sinks,
+                            events=args.events, period=args.period, concurrency=args.concurrency,
+                            chunk_size=args.chunk_size)
+    if args.once:
+        report = await watcher.cycle()
+        _log_report(report)
+        return 1 if report['failed'] else 0
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, watcher.stop)
+    _log(f"watching with schedule '{args.schedule}', sinks: {', '.join(args.sink or ['stdout'])}")
+    await watcher.run(args.schedule, run_on_start=True)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch portfolio tickers and emit stochastic signal alerts")
+    parser.add_argument('--schedule', default=DEFAULT_SCHEDULE, help="cron expression for update cycles")
+    parser.add_argument('--once', action='store_true', help="run one cycle and exit (non-zero if any ticker failed)")
+    parser.add_argument('--sink', action='append', help="stdout, file:<path> or an http(s) webhook URL (repeatable)")
+    parser.add_argument('--events', nargs='+', choices=EVENT_TYPES, default=ALERT_EVENTS)
+    parser.add_argument('--tickers', nargs='+', default=[], help="symbols to watch besides the portfolio")
+    parser.add_argument('--universe', action='append', help="also watch a bundled universe, e.g. 'S&P 500'")
+    parser.add_argument('--period', default=WATCH_PERIOD)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--db', help="signal index path (defaults to the app's)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_main(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import inspect
+import random
+import re
+
+from original_fundamentals import analyze_fundamentals as original_analyze
+from original_fundamentals import get_sector_from_info as original_sector
+from sterncurve.fundamentals import METRICS, SECTOR_PROFILES, analyze_fundamentals, classify_sector, \
+    classify_sectors, fundamentals_frame, score_fundamentals
+
+# Keywords and thresholds are read from the original code rather than the rule tables, so a
+# table that drifts from it can't also move the test data along with it.
+WORDS = sorted(set(re.findall(r"'([a-z ]+)' in (?:sector|industry)", inspect.getsource(original_sector)))
+               | {'services', 'equipment', 'regional', 'specialty', 'diversified', '&', '—'})
+THRESHOLDS = sorted({float(n) for n in re.findall(r"[<>]=? *(-?\d+(?:\.\d+)?(?:e\d+)?)", inspect.getsource(original_analyze))})
+
+
+def labels(rng, count=500):
+    # Sector/industry strings built from the original keywords, so several rules often match at
+    # once and the precedence between them is exercised.
+    def text():
+        words = rng.sample(WORDS, rng.randint(0, 4))
+        return ' '.join(w.upper() if rng.random() < 0.2 else w.title() for w in words)
+    pairs = [(text(), text()) for _ in range(count)]
+    pairs += [('Financial Services', 'Banks—Regional'), ('Energy', 'Oil & Gas E&P'), ('Real Estate', 'REIT—Retail'),
+              ('Technology', 'Semiconductors'), ('Communication Services', 'Telecom Services'),
+              ('Utilities', 'Utilities—Regulated Electric'), ('Healthcare', 'Biotechnology'), ('', '')]
+    return pairs
+
+
+def test_classifier_matches_original_if_chain():
+    for sector, industry in labels(random.Random(0)):
+        assert classify_sector(sector, industry) == original_sector({'sector': sector, 'industry': industry}), \
+            (sector, industry)
+
+
+def test_batch_classifier_matches_single():
+    pairs = labels(random.Random(1)) + [(None, 'Banks'), ('Energy', None)]
+    sectors, industries = zip(*pairs)
+    expected = [classify_sector(s or '', i or '') for s, i in pairs]
+    assert list(classify_sectors(sectors, industries)) == expected
+
+
+def infos(rng, count=300):
+    # Metric values on, just either side of and around every threshold the original compares
+    # against, plus missing, None and zero, which it treated as absent.
+    candidates = {}
+    for key, multiplier in METRICS.values():
+        values = [None, 0, 'missing']
+        for bound in THRESHOLDS:
+            for value in (bound, bound * (1 - 1e-6), bound * (1 + 1e-6), bound * 0.5, bound * 2, -bound):
+                values.append(value / multiplier)
+        candidates[key] = values
+    candidates['forwardPE'] = candidates['trailingPE']
+    result = []
+    for _ in range(count):
+        info = {}
+        for key, values in candidates.items():
+            value = rng.choice(values)
+            if value != 'missing':
+                info[key] = value
+        result.append(info)
+    return result
+
+
+def test_scores_match_original_if_chains():
+    rng = random.Random(2)
+    sectors = list(SECTOR_PROFILES) + ['Other']
+    for sector in sectors:
+        for info in infos(rng):
+            assert analyze_fundamentals(info, sector) == original_analyze(info, sector), (sector, info)
+
+
+def test_batch_scores_match_original():
+    rng = random.Random(3)
+    batch = dict(enumerate(infos(rng, 600)))
+    sectors = [rng.choice(list(SECTOR_PROFILES) + ['Other']) for _ in batch]
+    scores = score_fundamentals(fundamentals_frame(batch), sectors, details=True)
+    for (ticker, info), sector in zip(batch.items(), sectors):
+        expected = original_analyze(info, sector)
+        row = scores.loc[ticker]
+        assert (row['rating'], row['recommendation']) == (expected['rating'], expected['recommendation'])
+        assert (row['strengths'], row['weaknesses']) == (expected['strengths'], expected['weaknesses'])
@@ -0,0 +1,71 @@
+import threading
+
+import pandas as pd
+
+from sterncurve.price_store import PriceStore
+from sterncurve.providers import MarketDataProvider
+
+
+class GatedProvider(MarketDataProvider):
+    # History for 'SLOW' blocks until released, so a test can hold one fetch in flight.
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+
+    def history(self, ticker, period=None, start=None):
+        self.calls.append((ticker, period, start))
+        if ticker == 'SLOW':
+            self.started.set()
+            self.release.wait(10)
+        index = pd.bdate_range('2024-01-01', periods=300)
+        if start is not None:
+            index = index[index >= pd.Timestamp(start)]
+        close = (index - pd.Timestamp('2024-01-01')).days.to_numpy().astype(float) + 100
+        return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': close},
+                            index=index)
+
+    def info(self, ticker):
+        return {}
+
+
+def test_fetch_does_not_block_other_tickers():
+    provider = GatedProvider()
+    store = PriceStore(':memory:', provider=provider)
+    slow = threading.Thread(target=store.get_history, args=('SLOW', '1y'))
+    fast = threading.Thread(target=store.get_history, args=('FAST', '1y'))
+    slow.start()
+    try:
+        assert provider.started.wait(10)
+        # SLOW's download is still in flight; another ticker must be fetched and stored meanwhile.
+        fast.start()
+        fast.join(5)
+        assert not fast.is_alive()
+    finally:
+        provider.release.set()
+        slow.join()
+        fast.join()
+    assert len(store.get_history('FAST', '1y')) > 0
+    assert len(store.get_history('SLOW', '1y')) > 0
+
+
+def test_fresh_hit_skips_fetch():
+    provider = GatedProvider()
+    provider.release.set()
+    store = PriceStore(':memory:', provider=provider, max_age=300)
+    first = store.get_history('AAA', '1y')
+    provider.calls.clear()
+    again = store.get_history('AAA', '1y')
+    assert provider.calls == []
+    assert again.equals(first)
+
+
+def test_incremental_refresh_appends_to_history():
+    provider = GatedProvider()
+    provider.release.set()
+    store = PriceStore(':memory:', provider=provider, max_age=0)
+    store.get_history('AAA', 'max')
+    provider.calls.clear()
+    history = store.get_history('AAA', 'max')
+    assert [call[2] for call in provider.calls] == [history.index[-2].strftime('%Y-%m-%d')]
+    assert len(history) == 300 and history.index.is_unique
@@ -0,0 +1,10 @@
+from sterncurve.report import info_version
+
+
+def test_info_version_follows_fields_the_report_uses():
+    info = {'longName': 'Apple Inc.', 'sector': 'Technology', 'returnOnEquity': 1.5, 'website': 'apple.com'}
+    assert info_version(info) == info_version(dict(info, website='example.com'))
+    assert info_version(info) != info_version(dict(info, returnOnEquity=1.6))
+    assert info_version(info) != info_version(dict(info, sector='Financial Services'))
+    assert info_version(info) != info_version(dict(info, forwardPE=20.0))
+    assert info_version({}) is None
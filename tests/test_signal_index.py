@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from sterncurve.signal_index import SignalIndex
+
+
+def universe(tickers=12, bars=600, seed=0):
+    # Half random walks, half whole-dollar prices where %K/%D ties and flat windows are common.
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2020-01-01', periods=bars)
+    frames = {}
+    for i in range(tickers):
+        if i % 2:
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+            high, low = close * (1 + rng.uniform(0, 0.02, bars)), close * (1 - rng.uniform(0, 0.02, bars))
+        else:
+            close = np.maximum(100 + np.cumsum(rng.integers(-2, 3, bars)), 1).astype(float)
+            high, low = close + rng.integers(0, 2, bars), close - rng.integers(0, 2, bars)
+        frames[f"T{i:02d}"] = pd.DataFrame({'Open': close, 'High': high, 'Low': low, 'Close': close}, index=index)
+    return pd.concat(frames, axis=1)
+
+
+def events(index, **query):
+    # query() orders by date and ticker only, so fix the order of same-bar events for comparing.
+    found = index.query(**query)
+    return found.sort_values(['date', 'ticker', 'event'], ascending=[False, True, True], ignore_index=True)
+
+
+def rebuilt(bulk, **query):
+    index = SignalIndex(':memory:')
+    index.ingest_bulk(bulk)
+    return events(index, **query)
+
+
+def test_streamed_ingest_matches_full_rebuild():
+    bulk = universe()
+    index = SignalIndex(':memory:')
+    rng = np.random.default_rng(1)
+    for ticker in dict.fromkeys(bulk.columns.get_level_values(0)):
+        data = bulk[ticker]
+        position = 200
+        index.ingest(ticker, data.iloc[:position])
+        while position < len(data):
+            end = min(position + int(rng.integers(1, 8)), len(data))
+            # Each update overlaps the stored bars, and most first deliver a partial last bar
+            # that the next update revises.
+            update = data.iloc[position - 20:end]
+            if end < len(data):
+                partial = update.copy()
+                partial.iloc[-1, partial.columns.get_loc('Close')] *= 1.01
+                partial.iloc[-1, partial.columns.get_loc('High')] = partial['Close'].iloc[-1] * 1.01
+                index.ingest(ticker, partial)
+            index.ingest(ticker, update)
+            position = end
+    expected = rebuilt(bulk)
+    assert len(expected) > 500
+    pd.testing.assert_frame_equal(events(index), expected)
+
+
+def test_bulk_update_matches_full_rebuild():
+    bulk = universe(seed=2)
+    index = SignalIndex(':memory:')
+    index.ingest_bulk(bulk.iloc[:-5])
+    for end in range(len(bulk) - 4, len(bulk) + 1):
+        index.ingest_bulk(bulk.iloc[end - 3:end])
+    pd.testing.assert_frame_equal(events(index), rebuilt(bulk))
+
+
+def test_adjusted_history_rebuilds():
+    bulk = universe(seed=3)
+    index = SignalIndex(':memory:')
+    index.ingest_bulk(bulk.iloc[:-1])
+    # A 2:1 split rescales every bar, so the stored anchor no longer matches and the ticker is
+    # rebuilt from what was delivered. Earlier events are kept, and %K/%D don't change with scale.
+    split = bulk['T01'] / 2
+    index.ingest('T01', split.iloc[-40:])
+    found = events(index, tickers='T01')
+    expected = rebuilt(bulk, tickers='T01')
+    columns = ['ticker', 'date', 'event', 'k', 'd']
+    pd.testing.assert_frame_equal(found[columns], expected[columns])
+    # Events from the bar after the delivered data's first %D on are re-recorded at split prices.
+    recent = found['date'] >= split.index[-40 + 16].strftime('%Y-%m-%d')
+    assert recent.any()
+    assert np.array_equal(found.loc[recent, 'close'], expected.loc[recent, 'close'] / 2)
+
+
+def test_ingest_changes_reports_only_new_events():
+    bulk = universe(seed=4)
+    index = SignalIndex(':memory:')
+    assert index.ingest_changes(bulk.iloc[:-3]).empty
+    changes = index.ingest_changes(bulk.iloc[-10:])
+    full = rebuilt(bulk)
+    # The bar before these was already indexed as the last bar; re-delivered unchanged it fires
+    # nothing new.
+    fresh = full[full['date'].isin(bulk.index[-3:].strftime('%Y-%m-%d'))]
+    key = ['ticker', 'date', 'event']
+    assert sorted(map(tuple, changes[key].to_numpy())) == sorted(map(tuple, fresh[key].to_numpy()))
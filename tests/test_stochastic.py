@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+
+from sterncurve.stochastic import StochasticState, calculate_stochastic, scan_stochastic, stochastic_matrix
+
+
+def pandas_stochastic(high, low, close, k_period=14, d_period=3):
+    # The original pandas implementation. The only intended difference is that a flat window
+    # (highest == lowest) reads 50 instead of the NaN/inf of 0/0.
+    lowest_low = low.rolling(window=k_period).min()
+    highest_high = high.rolling(window=k_period).max()
+    k = ((close - lowest_low) / (highest_high - lowest_low)) * 100
+    k = k.where(highest_high != lowest_low, 50.0)
+    return k, k.rolling(window=d_period).mean()
+
+
+def tied_prices(n=2000, seed=0):
+    # Prices on a whole-cent grid, with runs of closes at new highs (K = 100, 100, 100), at new
+    # lows (K = 0) and flat stretches (span 0), so %K == %D happens often and exactly.
+    rng = np.random.default_rng(seed)
+    close = np.empty(n)
+    price = 100.0
+    i = 0
+    while i < n:
+        kind = rng.integers(0, 4)
+        run = int(rng.integers(3, 25))
+        for _ in range(min(run, n - i)):
+            if kind == 0:
+                price += 1.0
+            elif kind == 1:
+                price = max(price - 1.0, 1.0)
+            elif kind == 2:
+                price += float(rng.integers(-3, 4))
+                price = max(price, 1.0)
+            close[i] = price
+            i += 1
+    spread = rng.integers(0, 3, n).astype(float)
+    high = np.where(np.diff(close, prepend=close[0]) > 0, close, close + spread)
+    low = np.where(np.diff(close, prepend=close[0]) < 0, close, close - spread)
+    flat = np.diff(close, prepend=np.nan) == 0
+    high[flat], low[flat] = close[flat], close[flat]
+    index = pd.RangeIndex(n)
+    return pd.Series(high, index), pd.Series(low, index), pd.Series(close, index)
+
+
+def flags(k, d):
+    k, d = np.asarray(k, dtype=float), np.asarray(d, dtype=float)
+    prev_k, prev_d = np.r_[np.nan, k[:-1]], np.r_[np.nan, d[:-1]]
+    return {
+        'k_above_d': k > d,
+        'k_below_d': k < d,
+        'bullish_cross': (prev_k <= prev_d) & (k > d),
+        'bearish_cross': (prev_k >= prev_d) & (k < d)
+    }
+
+
+def test_matches_pandas_on_ties_and_flat_windows():
+    for seed in range(5):
+        high, low, close = tied_prices(seed=seed)
+        k_ref, d_ref = pandas_stochastic(high, low, close)
+        k, d = calculate_stochastic(high, low, close)
+        assert np.allclose(k, k_ref, equal_nan=True, rtol=0, atol=1e-9)
+        assert np.allclose(d, d_ref, equal_nan=True, rtol=0, atol=1e-9)
+
+        # Windows of three equal readings (K pinned at 100 or 0, flat stretches at 50) must give
+        # D == K exactly, as pandas does.
+        k_values = k.to_numpy()
+        equal = np.r_[False, False, (k_values[2:] == k_values[1:-1]) & (k_values[1:-1] == k_values[:-2])]
+        assert equal.sum() > 50
+        assert np.array_equal(d.to_numpy()[equal], k_values[equal])
+
+        # When K is the midpoint of the two readings before it, D equals K only up to rounding.
+        # pandas' running sum carries error from the whole history (75, 25, 50 can average to
+        # 50.00000000000001 there), so these near-ties can go either way and are the only bars
+        # allowed to differ, along with the crossover check on the bar after.
+        near_tie = ~equal & ((np.abs(k_values - d_ref.to_numpy()) <= 1e-12) | (np.abs(k_values - d.to_numpy()) <= 1e-12))
+        assert near_tie.sum() < 0.02 * len(k_values)
+        exact = ~(near_tie | np.r_[False, near_tie[:-1]])
+        expected = flags(k_ref, d_ref)
+        for name, mask in flags(k, d).items():
+            assert np.array_equal(mask[exact], expected[name][exact]), name
+
+
+def test_three_new_highs_tie():
+    close = pd.Series([10.0, 11, 12, 13, 14, 15, 16])
+    k, d = calculate_stochastic(close, close - 1, close, k_period=3, d_period=3)
+    assert list(k.iloc[-3:]) == [100.0, 100.0, 100.0]
+    assert d.iloc[-1] == 100.0
+    assert not k.iloc[-1] > d.iloc[-1]
+
+
+def test_matrix_matches_per_ticker_series():
+    columns = [tied_prices(seed=seed) for seed in range(4)]
+    high, low, close = (np.column_stack([c[i].to_numpy() for c in columns]) for i in range(3))
+    k, d = stochastic_matrix(high, low, close)
+    for j, (h, l, c) in enumerate(columns):
+        k_one, d_one = calculate_stochastic(h, l, c)
+        assert np.array_equal(k[:, j], k_one.to_numpy(), equal_nan=True)
+        assert np.array_equal(d[:, j], d_one.to_numpy(), equal_nan=True)
+
+
+def test_streaming_state_matches_vectorized_exactly():
+    high, low, close = tied_prices(seed=7)
+    k, d = calculate_stochastic(high, low, close)
+    state = StochasticState()
+    streamed = np.array([state.update(h, l, c) for h, l, c in zip(high, low, close)])
+    assert np.array_equal(streamed[:, 0], k.to_numpy(), equal_nan=True)
+    assert np.array_equal(streamed[:, 1], d.to_numpy(), equal_nan=True)
+
+
+def test_scan_flags_match_pandas():
+    series = {f"T{seed}": tied_prices(n=60, seed=seed) for seed in range(40)}
+    bulk = pd.concat({t: pd.DataFrame({'High': h, 'Low': l, 'Close': c}) for t, (h, l, c) in series.items()},
+                     axis=1)
+    scan = scan_stochastic(bulk).set_index('ticker')
+    for ticker, (high, low, close) in series.items():
+        k, d = pandas_stochastic(high, low, close)
+        row = scan.loc[ticker]
+        assert row['bullish_cross'] == bool(k.iloc[-2] <= d.iloc[-2] and k.iloc[-1] > d.iloc[-1])
+        assert row['bearish_cross'] == bool(k.iloc[-2] >= d.iloc[-2] and k.iloc[-1] < d.iloc[-1])
+        assert (row['stoch_k'] > row['stoch_d']) == (k.iloc[-1] > d.iloc[-1])
+
+
+def original_score(k, d, momentum, trend):
+    score = 50
+    if k < 20:
+        score += 20
+    elif k > 80:
+        score -= 20
+    if k > d:
+        score += 10
+    else:
+        score -= 10
+    if momentum > 10:
+        score += 15
+    elif momentum > 0:
+        score += 5
+    elif momentum > -10:
+        score -= 5
+    else:
+        score -= 15
+    if trend == "bullish":
+        score += 5
+    elif trend == "bearish":
+        score -= 5
+    return max(0, min(100, score))
+
+
+def original_discover_row(data):
+    # The per-ticker body of the original Discover loop, on the pandas stochastic.
+    k, d = pandas_stochastic(data['High'], data['Low'], data['Close'])
+    current_k, current_d = k.iloc[-1], d.iloc[-1]
+    momentum = current_k - k.iloc[-5]
+    recent_k = k.iloc[-10:]
+    trend = "bullish" if recent_k.is_monotonic_increasing else "bearish" if recent_k.is_monotonic_decreasing else "mixed"
+    return {
+        'price': data['Close'].iloc[-1],
+        'change': (data['Close'].iloc[-1] / data['Close'].iloc[0] - 1) * 100,
+        'stoch_k': current_k,
+        'stoch_d': current_d,
+        'momentum': momentum,
+        'trend': trend,
+        'position': "Oversold" if current_k < 20 else "Overbought" if current_k > 80 else "Neutral",
+        'score': original_score(current_k, current_d, momentum, trend),
+        'bullish_cross': bool(k.iloc[-2] <= d.iloc[-2] and current_k > current_d),
+        'bearish_cross': bool(k.iloc[-2] >= d.iloc[-2] and current_k < current_d)
+    }
+
+
+def test_scan_matches_original_discover_loop():
+    # Tickers of different lengths share one date index, so shorter ones start with NaN rows.
+    index = pd.RangeIndex(80)
+    frames = {}
+    for seed in range(60):
+        high, low, close = tied_prices(n=30 + seed % 50, seed=seed)
+        frame = pd.DataFrame({'High': high.to_numpy(), 'Low': low.to_numpy(), 'Close': close.to_numpy()},
+                             index=index[-len(close):])
+        frames[f"T{seed}"] = frame.reindex(index)
+    scan = scan_stochastic(pd.concat(frames, axis=1)).set_index('ticker')
+    assert len(scan) == len(frames)
+    compared = 0
+    for ticker, frame in frames.items():
+        expected = original_discover_row(frame.dropna())
+        row = scan.loc[ticker]
+        for name in ('price', 'change', 'stoch_k', 'stoch_d', 'momentum'):
+            assert np.isclose(row[name], expected[name], rtol=0, atol=1e-9), (ticker, name)
+        assert (row['trend'], row['position']) == (expected['trend'], expected['position']), ticker
+        # Same near-tie exemption as above: pandas may put D a few ulps off an exact K == D. Ties
+        # both sides compute exactly are still compared.
+        gaps = abs(expected['stoch_k'] - expected['stoch_d']), abs(row['stoch_k'] - row['stoch_d'])
+        if max(gaps) > 0 and min(gaps) <= 1e-12:
+            continue
+        compared += 1
+        assert row['score'] == expected['score'], ticker
+        assert (row['bullish_cross'], row['bearish_cross']) == (expected['bullish_cross'],
+                                                                 expected['bearish_cross']), ticker
+    assert compared > len(frames) // 2
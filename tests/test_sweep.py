@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from sterncurve.sweep import sweep
+
+
+def bulk_frame(tickers=('AAA', 'BBB'), bars=300, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2024-01-01', periods=bars)
+    frames = {}
+    for ticker in tickers:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+        frames[ticker] = pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close},
+                                      index=index)
+    return pd.concat(frames, axis=1)
+
+
+def test_ranks_settings():
+    ranked = sweep(bulk_frame(), grid={'k_period': [9, 14], 'd_period': [3]}, min_trades=1, workers=1)
+    assert len(ranked) > 0
+    assert (ranked['oversold'] < ranked['overbought']).all()
+    assert ranked['avg_fwd_10'].is_monotonic_decreasing
+
+
+def test_no_valid_threshold_pair_returns_empty_ranking():
+    ranked = sweep(bulk_frame(), grid={'oversold': [50], 'overbought': [40]}, workers=1)
+    assert ranked.empty
+    assert list(ranked.columns) == ['k_period', 'd_period', 'oversold', 'overbought', 'trades', 'hit_rate',
+                                    'avg_return', 'avg_fwd_10', 'avg_drawdown']
+
+
+def test_no_data_returns_empty_ranking():
+    assert sweep(pd.DataFrame(), workers=1).empty
+    assert 'trades' in sweep(None, workers=1).columns
@@ -0,0 +1,37 @@
+import random
+
+from sterncurve.symbols import DeletionIndex, PrefixIndex, SymbolIndex
+
+
+def test_prefix_index_matches_brute_force():
+    rng = random.Random(0)
+    keys = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 5))) for _ in range(500)]
+    index = PrefixIndex(limit=8)
+    for rank, key in enumerate(keys):
+        index.insert(key, rank)
+    for query in ['', 'a', 'ab', 'abc', 'cba', 'bbbbb', 'abcabc']:
+        assert index.prefix(query) == sorted({r for r, k in enumerate(keys) if k.startswith(query)})[:8]
+        assert index.exact(query) == [r for r, k in enumerate(keys) if k == query]
+    # Inserts after a lookup are merged in on the next one.
+    index.insert('abcabc', 500)
+    assert index.exact('abcabc') == [500]
+
+
+def test_deletion_index_finds_one_edit_away():
+    index = DeletionIndex()
+    for rank, key in enumerate(['NVDA', 'GOOGL', 'MSFT']):
+        index.insert(key, rank)
+    assert index.lookup('NVDIA') == [0]
+    assert index.lookup('GOGL') == [1]
+    assert index.lookup('MSTF') == [2]
+    assert index.lookup('XYZ') == []
+
+
+def test_symbol_index_search_and_resolve():
+    index = SymbolIndex()
+    assert index.resolve('aapl') == 'AAPL'
+    assert index.resolve('brk.b') == 'BRK-B'
+    assert index.resolve('tesla') == 'TSLA'
+    assert index.resolve('not a listing') is None
+    assert index.search('AAP', 3)[0][0] == 'AAPL'
+    assert 'NVDA' in [symbol for symbol, _ in index.search('nvdia', 5)]